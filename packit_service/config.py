@@ -303,6 +303,12 @@ class ServiceConfig(Config):
             return projects[0]
         return None
 
+    @property
+    def fedora_ci_comment_command_prefix(self) -> str:
+        # TODO: remove this once Fedora CI has its own instances and comment_command_prefixes
+        # comment_command_prefixes for Fedora CI are /packit-ci and /packit-ci-stg
+        return "/packit-ci-stg" if self.comment_command_prefix.endswith("-stg") else "/packit-ci"
+
     def get_github_account_name(self) -> str:
         return {
             Deployment.prod: "packit-as-a-service[bot]",
@@ -62,6 +62,16 @@ MSG_RETRIGGER_DISTGIT = (
     "into any open open pull request in dist-git."
 )
 
+COPR_SUCCESSFUL_BUILD_COMMENT = (
+    "Congratulations! One of the builds has completed. :champagne:\n\n"
+    "You can install the built RPMs by following these steps:\n\n"
+    "* `sudo yum install -y dnf-plugins-core` on RHEL 8\n"
+    "* `sudo dnf install -y dnf-plugins-core` on Fedora\n"
+    "* `dnf copr enable {owner}/{project}`\n"
+    "* And now you can install the packages.\n"
+    "\nPlease note that the RPMs should be used only in a testing environment."
+)
+
 COPR_CHROOT_CHANGE_MSG = (
     "Settings of a Copr project {owner}/{project} need to be updated, "
     "but Packit can't do that when there are previous builds still in progress.\n"
@@ -2091,12 +2091,17 @@ class BuildStatus(str, enum.Enum):
 
     @staticmethod
     def is_final_state(status: "BuildStatus"):
-        return status in {
-            BuildStatus.success,
-            BuildStatus.failure,
-            BuildStatus.error,
-            BuildStatus.canceled,
-        }
+        return status in FINAL_BUILD_STATUSES
+
+
+FINAL_BUILD_STATUSES = frozenset(
+    {
+        BuildStatus.success,
+        BuildStatus.failure,
+        BuildStatus.error,
+        BuildStatus.canceled,
+    },
+)
 
 
 class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
@@ -2202,6 +2207,22 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
         with sa_session_transaction() as session:
             return session.query(CoprBuildTargetModel).filter_by(id=id_).first()
 
+    @classmethod
+    def get_project_event_by_build_id(cls, id_: int) -> Optional["ProjectEventModel"]:
+        """Returns the project event of the build with the given (our) ID
+        without loading the build, its group and pipelines one by one.
+        """
+        with sa_session_transaction() as session:
+            return (
+                session.query(ProjectEventModel)
+                .join(PipelineModel)
+                .join(CoprBuildGroupModel)
+                .join(CoprBuildTargetModel)
+                .filter(CoprBuildTargetModel.id == id_)
+                .order_by(PipelineModel.id)
+                .first()
+            )
+
     @classmethod
     def get_all(cls) -> Iterable["CoprBuildTargetModel"]:
         with sa_session_transaction() as session:
@@ -2257,6 +2278,29 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
         with sa_session_transaction() as session:
             return session.query(CoprBuildTargetModel).filter_by(build_id=build_id)
 
+    @classmethod
+    def get_build_and_targets_by_copr_build_id(
+        cls,
+        copr_build_id: Union[str, int],
+    ) -> tuple[Optional["SRPMBuildModel"], list["CoprBuildTargetModel"]]:
+        """Returns the SRPM build built in Copr together with its RPM build targets."""
+        if isinstance(copr_build_id, int):
+            # See the comment in get_by_task_id()
+            copr_build_id = str(copr_build_id)
+        with sa_session_transaction() as session:
+            rows = (
+                session.query(SRPMBuildModel, CoprBuildTargetModel)
+                .outerjoin(
+                    CoprBuildTargetModel,
+                    CoprBuildTargetModel.build_id == SRPMBuildModel.copr_build_id,
+                )
+                .filter(SRPMBuildModel.copr_build_id == copr_build_id)
+                .all()
+            )
+        if not rows:
+            return None, []
+        return rows[0][0], [target for _, target in rows if target]
+
     @classmethod
     def get_all_by_status(cls, status: BuildStatus) -> Iterable["CoprBuildTargetModel"]:
         """Returns all builds which currently have the given status."""
@@ -2289,10 +2333,14 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
         owner: Optional[str] = None,
         target: Optional[str] = None,
         status: BuildStatus = None,
+        project_event_object_id: Optional[int] = None,
     ) -> Iterable["CoprBuildTargetModel"]:
         """
         All owner/project_name builds sorted from latest to oldest
         with the given commit_sha and optional target.
+
+        If project_event_object_id is given, only the builds triggered
+        by the project event object (e.g. pull request) with that ID are returned.
         """
         with sa_session_transaction() as session:
             query = (
@@ -2319,6 +2367,8 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
                 query = query.filter(CoprBuildTargetModel.target == target)
             if status:
                 query = query.filter(CoprBuildTargetModel.status == status)
+            if project_event_object_id is not None:
+                query = query.filter(ProjectEventModel.event_id == project_event_object_id)
 
             return query
 
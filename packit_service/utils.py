@@ -3,6 +3,7 @@
 
 import logging
 import os
+from contextlib import suppress
 from datetime import datetime, timezone
 from io import StringIO
 from logging import StreamHandler
@@ -22,6 +23,8 @@ logger = logging.getLogger(__name__)
 
 LoggingLevel = int
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class only_once:
     """
@@ -72,18 +75,14 @@ def get_package_nvrs(built_packages: list[dict]) -> list[str]:
     Returns:
         list of nvrs
     """
-    packages = []
-    for package in built_packages:
-        if package["arch"] == "src":
-            continue
-
-        epoch = f"{package['epoch']}:" if package["epoch"] else ""
-
-        packages.append(
-            f"{package['name']}-{epoch}{package['version']
-                                        }-{package['release']}.{package['arch']}",
-        )
-    return packages
+    return [
+        f"{package['name']}-{package['epoch']}:{package['version']}-"
+        f"{package['release']}.{package['arch']}"
+        if package["epoch"]
+        else f"{package['name']}-{package['version']}-{package['release']}.{package['arch']}"
+        for package in built_packages
+        if package["arch"] != "src"
+    ]
 
 
 def log_package_versions(package_versions: list[tuple[str, str]]):
@@ -290,8 +289,15 @@ def download_file(url: str, path: Path):
         ) as response:
             response.raise_for_status()
             with open(path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                if content_length := response.headers.get("Content-Length"):
+                    # let the filesystem allocate the space in one go
+                    # instead of growing the file with every chunk
+                    with suppress(AttributeError, OSError, ValueError):
+                        os.posix_fallocate(f.fileno(), 0, int(content_length))
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
+                # drop the preallocated space that has not been written to
+                f.truncate()
     except requests.exceptions.RequestException as e:
         msg = f"Failed to download file from {url}"
         logger.debug(f"{msg}: {e!r}")
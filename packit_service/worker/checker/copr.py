@@ -46,17 +46,19 @@ class IsGitForgeProjectAndEventOk(
             # Not interested in closed merge requests
             return False
 
-        if not (self.copr_build_helper.job_build or self.copr_build_helper.job_tests_all):
+        copr_build_helper = self.copr_build_helper
+        if not (copr_build_helper.job_build or copr_build_helper.job_tests_all):
             logger.info("No copr_build or tests job defined.")
             # we can't report it to end-user at this stage
             return False
 
-        if self.copr_build_helper.is_custom_copr_project_defined():
+        if copr_build_helper.is_custom_copr_project_defined():
             logger.debug(
                 "Custom Copr owner/project set. "
                 "Checking if this GitHub project can use this Copr project.",
             )
-            if not self.copr_build_helper.check_if_custom_copr_can_be_used_and_report():
+            # the only check talking to the Copr API, keep it last
+            if not copr_build_helper.check_if_custom_copr_can_be_used_and_report():
                 return False
 
         return True
@@ -5,6 +5,7 @@ import json
 import logging
 import shutil
 import tempfile
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -47,51 +48,35 @@ class IsRunConditionSatisfied(Checker, ConfigFromEventMixin, PackitAPIWithUpstre
             event=event,
             task_name=task_name,
         )
-        self._handler_kls = None
-        self._working_dir: Optional[Path] = None
-        self._command_handler: Optional[CommandHandler] = None
-        self._actions_handler: Optional[ActionsHandler] = None
 
-    @property
+    @cached_property
     def handler_kls(self):
-        if self._handler_kls is None:
-            logger.debug(f"Command handler: {self.service_config.command_handler}")
-            self._handler_kls = RUN_COMMAND_HANDLER_MAPPING[self.service_config.command_handler]
-        return self._handler_kls
-
-    @property
-    def working_dir(self) -> Optional[Path]:
-        if not self._working_dir:
-            if self.handler_kls == SandcastleCommandHandler:
-                path = (
-                    Path(self.service_config.command_handler_work_dir) / "run-condition-working-dir"
-                )
-                path.mkdir(parents=True, exist_ok=True)
-                self._working_dir = path
-            else:
-                self._working_dir = Path(tempfile.mkdtemp())
-            logger.info(
-                f"Created directory for the run-condition action: {self._working_dir}",
-            )
-        return self._working_dir
+        logger.debug(f"Command handler: {self.service_config.command_handler}")
+        return RUN_COMMAND_HANDLER_MAPPING[self.service_config.command_handler]
+
+    @cached_property
+    def working_dir(self) -> Path:
+        if self.handler_kls == SandcastleCommandHandler:
+            path = Path(self.service_config.command_handler_work_dir) / "run-condition-working-dir"
+            path.mkdir(parents=True, exist_ok=True)
+        else:
+            path = Path(tempfile.mkdtemp())
+        logger.info(f"Created directory for the run-condition action: {path}")
+        return path
 
-    @property
+    @cached_property
     def command_handler(self) -> CommandHandler:
-        if self._command_handler is None:
-            self._command_handler = self.handler_kls(
-                config=self.service_config,
-                working_dir=self.working_dir,
-            )
-        return self._command_handler
+        return self.handler_kls(
+            config=self.service_config,
+            working_dir=self.working_dir,
+        )
 
-    @property
+    @cached_property
     def actions_handler(self) -> ActionsHandler:
-        if not self._actions_handler:
-            self._actions_handler = ActionsHandler(
-                self.job_config,
-                self.command_handler,
-            )
-        return self._actions_handler
+        return ActionsHandler(
+            self.job_config,
+            self.command_handler,
+        )
 
     def common_env(
         self, version: Optional[str] = None, extra_env: Optional[dict[str, str]] = None
@@ -197,7 +182,7 @@ class IsRunConditionSatisfied(Checker, ConfigFromEventMixin, PackitAPIWithUpstre
     def clean_working_dir(self) -> None:
         if self.job_config.clone_repos_before_run_condition:
             self.packit_api.up.clean_working_dir()
-        else:
-            if self._working_dir:
-                logger.debug(f"Cleaning: {self.working_dir}")
-                shutil.rmtree(self.working_dir, ignore_errors=True)
+        # only clean up the directory if it has actually been created
+        elif "working_dir" in self.__dict__:
+            logger.debug(f"Cleaning: {self.working_dir}")
+            shutil.rmtree(self.working_dir, ignore_errors=True)
@@ -347,18 +347,18 @@ class Handler(PackitAPIProtocol, Config):
         Returns
             bool: False if we have to skip the job execution.
         """
-        checks_pass = True
-        for checker_cls in cls.get_checkers():
-            task_name = getattr(cls, "task_name", None)
-            checker = checker_cls(
+        task_name = getattr(cls, "task_name", None)
+        task_name = task_name.value if task_name else None
+        # stop at the first failing checker, the rest is not even constructed
+        return all(
+            checker_cls(
                 package_config=package_config,
                 job_config=job_config,
                 event=event,
-                task_name=task_name.value if task_name else None,
-            )
-            checks_pass = checks_pass and checker.pre_check()
-
-        return checks_pass
+                task_name=task_name,
+            ).pre_check()
+            for checker_cls in cls.get_checkers()
+        )
 
     @staticmethod
     def get_handler_specific_task_accepted_message(
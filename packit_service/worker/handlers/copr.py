@@ -3,11 +3,12 @@
 
 import logging
 import os
+import time
 from datetime import datetime, timezone
-import re
+from functools import cached_property
 from typing import Optional
 from packit.config.common_package_config import CommonPackageConfig
-from celery import Task, signature
+from celery import Task, group, signature
 from ogr.abstract import GitProject
 from ogr.services.github import GithubProject
 from ogr.services.gitlab import GitlabProject
@@ -25,13 +26,10 @@ from packit_service.config import ServiceConfig
 from packit_service.constants import (
     COPR_API_SUCC_STATE,
     COPR_SRPM_CHROOT,
+    COPR_SUCCESSFUL_BUILD_COMMENT,
 )
 from packit_service.events import abstract, copr, forgejo, github, gitlab
-from packit_service.models import (
-    BuildStatus,
-    CoprBuildTargetModel,
-    ProjectEventModelType,
-)
+from packit_service.models import BuildStatus, ProjectEventModelType
 from packit_service.package_config_getter import PackageConfigGetter
 from packit_service.service.urls import get_copr_build_info_url, get_srpm_build_info_url
 from packit_service.utils import (
@@ -71,6 +69,42 @@ from packit_service.worker.result import TaskResults
 
 logger = logging.getLogger(__name__)
 
+# the environment of the worker doesn't change, read it only once
+CANCEL_RUNNING_JOBS = bool(os.getenv("CANCEL_RUNNING_JOBS"))
+
+# statuses of builds for which the end has already been processed
+_PROCESSED_BUILD_STATUSES = frozenset({BuildStatus.success, BuildStatus.failure})
+
+
+def get_fedora_ci_job_config(job_type: JobType = JobType.copr_build) -> JobConfig:
+    """
+    Job config of the Fedora CI COPR builds (or their tests).
+
+    The configuration is the same every time, but a new instance is created
+    for every handler since the configs may be modified while handling the job.
+    """
+    return JobConfig(
+        type=job_type,
+        trigger=JobConfigTriggerType.pull_request,
+        packages={
+            "hello": CommonPackageConfig(_targets=["fedora-rawhide-x86_64"]),
+        },
+    )
+
+
+def get_fedora_ci_package_config() -> PackageConfig:
+    """Package config of the Fedora CI COPR builds, a new instance every time."""
+    return PackageConfig(
+        packages={
+            "hello": CommonPackageConfig(),  # no additional keys at top-level
+        },
+        jobs=[
+            get_fedora_ci_job_config(),
+            get_fedora_ci_job_config(JobType.tests),
+        ],
+    )
+
+
 class FedoraCICOPRHandler(FedoraCIJobHandler, RetriableJobHandler):
     task_name = TaskName.fedora_ci_copr_build
     check_name = "fedora-ci-copr-build"
@@ -96,45 +130,9 @@ class FedoraCICOPRHandler(FedoraCIJobHandler, RetriableJobHandler):
         self._package_config_from_pr = None
         self.celery_task = celery_task
         self._copr_build_group_id = copr_build_group_id
-        
-        # Extract owner from the event body
-        body = event.get("body", "")
-        # Look for FAS username pattern: "FAS username: @username" 
-        owner_match = re.search(r"FAS username:\s*@([^\s\n]+)", body)
-
-        # Store the original package_config passed to constructor
-        self._original_package_config = PackageConfig(
-            packages={
-                "hello": CommonPackageConfig()  # no additional keys at top-level
-            },
-            jobs=[
-                JobConfig(
-                    type=JobType.copr_build,
-                    trigger=JobConfigTriggerType.pull_request,
-                    packages={
-                        "hello": CommonPackageConfig(_targets=["fedora-rawhide-x86_64"])
-                    }
-                ),
-                JobConfig(
-                    type=JobType.tests,
-                    trigger=JobConfigTriggerType.pull_request,
-                    packages={
-                        "hello": CommonPackageConfig(_targets=["fedora-rawhide-x86_64"])
-                    }
-                )
-            ]
-        )
 
-        # Create job config for Fedora CI COPR build
-        self.job_config = JobConfig(
-            type=JobType.copr_build,
-            trigger=JobConfigTriggerType.pull_request,
-            packages={
-                "hello": CommonPackageConfig(
-                    _targets=["fedora-rawhide-x86_64"],
-                )
-            },
-        )
+        self._original_package_config = get_fedora_ci_package_config()
+        self.job_config = get_fedora_ci_job_config()
         # Call parent constructor with effective package config
         super().__init__(
             package_config=self._original_package_config,
@@ -181,24 +179,30 @@ class FedoraCICOPRHandler(FedoraCIJobHandler, RetriableJobHandler):
     def packit_api(self) -> PackitAPI:
         return None
 
-    @property
+    @cached_property
     def project_url(self) -> str:
         return f"https://codeberg.org/{self.event['base_repo_namespace']}/{self.event['base_repo_name']}"
 
+    @cached_property
+    def base_project_url(self) -> str:
+        return (
+            f"https://codeberg.org/{self.event['target_repo_namespace']}/"
+            f"{self.event['target_repo_name']}"
+        )
+
     def _get_config_from_pr(self):
         try:
-            self._base_project = self.service_config.get_project(
-                url=f"https://codeberg.org/{self.event['target_repo_namespace']}/{self.event['target_repo_name']}",
-            )
-
-            self._project = self.service_config.get_project(
-                url=self.project_url,
+            # PRs that are not opened from a fork have the same base and source project
+            self._base_project = (
+                self.project
+                if self.base_project_url == self.project_url
+                else self.service_config.get_project(url=self.base_project_url)
             )
 
             # Load package config from PR
             self._package_config_from_pr = PackageConfigGetter.get_package_config_from_repo(
                 base_project=self._base_project,
-                project=self._project,
+                project=self.project,
                 pr_id=self.event.get("identifier"),
                 reference="new_package"
             )
@@ -212,7 +216,7 @@ class FedoraCICOPRHandler(FedoraCIJobHandler, RetriableJobHandler):
         # [XXX] For now cancel only when an environment variable is defined,
         # should allow for less stressful testing and also optionally turning
         # the cancelling on-and-off on the prod
-        if os.getenv("CANCEL_RUNNING_JOBS"):
+        if CANCEL_RUNNING_JOBS:
             self.copr_build_helper.cancel_running_builds()
 
         return self.copr_build_helper.run_copr_build_from_source_script()
@@ -271,7 +275,7 @@ class CoprBuildHandler(
         # [XXX] For now cancel only when an environment variable is defined,
         # should allow for less stressful testing and also optionally turning
         # the cancelling on-and-off on the prod
-        if os.getenv("CANCEL_RUNNING_JOBS"):
+        if CANCEL_RUNNING_JOBS:
             self.copr_build_helper.cancel_running_builds()
 
         return self.copr_build_helper.run_copr_build_from_source_script()
@@ -287,6 +291,18 @@ class AbstractCoprBuildReportHandler(
     def get_checkers() -> tuple[type[Checker], ...]:
         return (AreOwnerAndProjectMatchingJob, IsPackageMatchingJobView)
 
+    @cached_property
+    def copr_event_time(self) -> Optional[datetime]:
+        """
+        Time of the Copr event as a naive UTC datetime (the way it is stored in the DB).
+        """
+        if not self.copr_event.timestamp:
+            return None
+        return datetime.fromtimestamp(
+            self.copr_event.timestamp,
+            timezone.utc,
+        ).replace(tzinfo=None)
+
 
 @configured_as(job_type=JobType.copr_build)
 @reacts_to(event=copr.Start)
@@ -302,12 +318,7 @@ class CoprBuildStartHandler(AbstractCoprBuildReportHandler):
         )
 
     def set_start_time(self):
-        start_time = (
-            datetime.utcfromtimestamp(self.copr_event.timestamp)
-            if self.copr_event.timestamp
-            else None
-        )
-        self.build.set_start_time(start_time)
+        self.build.set_start_time(self.copr_event_time)
 
     def set_logs_url(self):
         copr_build_logs = self.copr_event.get_copr_build_logs_url()
@@ -378,6 +389,19 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
     topic = "org.fedoraproject.prod.copr.build.end"
     task_name = TaskName.copr_build_end
 
+    @cached_property
+    def copr_api_build(self):
+        """Build as returned by the Copr API (fetched only once)."""
+        return self.copr_build_helper.get_build(self.copr_event.build_id)
+
+    @cached_property
+    def copr_api_build_chroot(self):
+        """Build chroot as returned by the Copr API (fetched only once)."""
+        return self.copr_build_helper.get_build_chroot(
+            int(self.build.build_id),
+            self.build.target,
+        )
+
     def set_srpm_url(self) -> None:
         # TODO how to do better
         srpm_build = (
@@ -390,32 +414,20 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             # URL has been already set
             return
 
-        srpm_url = self.copr_build_helper.get_build(
-            self.copr_event.build_id,
-        ).source_package.get("url")
+        srpm_url = self.copr_api_build.source_package.get("url")
 
         if srpm_url is not None:
             srpm_build.set_url(srpm_url)
 
     def set_end_time(self):
-        end_time = (
-            datetime.utcfromtimestamp(self.copr_event.timestamp)
-            if self.copr_event.timestamp
-            else None
-        )
-        self.build.set_end_time(end_time)
+        self.build.set_end_time(self.copr_event_time)
 
     def measure_time_after_reporting(self):
-        reported_time = datetime.now(timezone.utc)
-        build_ended_on = self.copr_build_helper.get_build_chroot(
-            int(self.build.build_id),
-            self.build.target,
-        ).ended_on
+        reported_time = time.time()
+        # ended_on is a POSIX timestamp, no need to convert to datetime
+        build_ended_on = self.copr_api_build_chroot.ended_on
 
-        reported_after_time = elapsed_seconds(
-            begin=datetime.fromtimestamp(build_ended_on, timezone.utc),
-            end=reported_time,
-        )
+        reported_after_time = reported_time - build_ended_on
         logger.debug(
             f"Copr build end reported after {reported_after_time / 60} minutes.",
         )
@@ -441,10 +453,7 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             logger.warning(msg)
             return TaskResults(success=False, details={"msg": msg})
 
-        if self.build.status in [
-            BuildStatus.success,
-            BuildStatus.failure,
-        ]:
+        if self.build.status in _PROCESSED_BUILD_STATUSES:
             msg = (
                 f"Copr build {self.copr_event.build_id} is already"
                 f" processed (status={self.copr_event.build.status})."
@@ -497,10 +506,10 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
         self.handle_testing_farm()
 
         if (
-            not CoprOpenScanHubHelper.osh_disabled()
-            and self.db_project_event.type == ProjectEventModelType.pull_request
+            self.job_config.osh_diff_scan_after_copr_build
             and self.build.target == "fedora-rawhide-x86_64"
-            and self.job_config.osh_diff_scan_after_copr_build
+            and self.db_project_event.type == ProjectEventModelType.pull_request
+            and not CoprOpenScanHubHelper.osh_disabled()
         ):
             try:
                 CoprOpenScanHubHelper(
@@ -524,14 +533,9 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             and isinstance(self.project, (GithubProject, GitlabProject))
             and self.job_config.notifications.pull_request.successful_build
         ):
-            msg = (
-                f"Congratulations! One of the builds has completed. :champagne:\n\n"
-                "You can install the built RPMs by following these steps:\n\n"
-                "* `sudo yum install -y dnf-plugins-core` on RHEL 8\n"
-                "* `sudo dnf install -y dnf-plugins-core` on Fedora\n"
-                f"* `dnf copr enable {self.copr_event.owner}/{self.copr_event.project_name}`\n"
-                "* And now you can install the packages.\n"
-                "\nPlease note that the RPMs should be used only in a testing environment."
+            msg = COPR_SUCCESSFUL_BUILD_COMMENT.format(
+                owner=self.copr_event.owner,
+                project=self.copr_event.project_name,
             )
             self.copr_build_helper.status_reporter.comment(
                 msg,
@@ -576,9 +580,7 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             )
             return TaskResults(success=False, details={"msg": failed_msg})
 
-        for build in CoprBuildTargetModel.get_all_by_build_id(
-            str(self.copr_event.build_id),
-        ):
+        for build in self._srpm_build_and_targets[1]:
             # from waiting_for_srpm to pending
             build.set_status(BuildStatus.pending)
 
@@ -602,9 +604,11 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             logger.debug("Testing farm not in the job config.")
             return
 
-        event_dict = self.data.get_dict()
-
-        for job_config in self.copr_build_helper.job_tests_all:
+        chroot = self.copr_event.chroot
+        copr_build_helper = self.copr_build_helper
+        matching_jobs = [
+            job_config
+            for job_config in copr_build_helper.job_tests_all
             if (
                 # we need to check the labels here
                 # the same way as when scheduling jobs for event
@@ -612,22 +616,36 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
                     job_config.trigger != JobConfigTriggerType.pull_request
                     or not (job_config.require.label.present or job_config.require.label.absent)
                 )
-                and self.copr_event.chroot
-                in self.copr_build_helper.build_targets_for_test_job(job_config)
-            ):
-                event_dict["tests_targets_override"] = [
-                    (target, job_config.identifier)
-                    for target in self.copr_build_helper.build_target2test_targets_for_test_job(
-                        self.copr_event.chroot,
-                        job_config,
-                    )
-                ]
-                signature(
-                    TaskName.testing_farm.value,
-                    kwargs={
-                        "package_config": dump_package_config(self.package_config),
-                        "job_config": dump_job_config(job_config),
-                        "event": event_dict,
-                        "build_id": self.build.id,
+                and chroot in copr_build_helper.build_targets_for_test_job(job_config)
+            )
+        ]
+        if not matching_jobs:
+            logger.debug(f"No tests job to run for {chroot}.")
+            return
+
+        event_dict = self.data.get_dict()
+        # the same for all the tasks, serialize only once
+        package_config = dump_package_config(self.package_config)
+        signatures = [
+            signature(
+                TaskName.testing_farm.value,
+                kwargs={
+                    "package_config": package_config,
+                    "job_config": dump_job_config(job_config),
+                    "event": {
+                        **event_dict,
+                        "tests_targets_override": [
+                            (target, job_config.identifier)
+                            for target in copr_build_helper.build_target2test_targets_for_test_job(
+                                chroot,
+                                job_config,
+                            )
+                        ],
                     },
-                ).apply_async()
+                    "build_id": self.build.id,
+                },
+            )
+            for job_config in matching_jobs
+        ]
+        # send all the tasks at once
+        group(signatures).apply_async()
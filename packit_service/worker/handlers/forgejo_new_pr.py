@@ -3,6 +3,7 @@ from packit_service.events.forgejo.pr import Action as ForgejoPrAction
 from packit_service.worker.result import TaskResults
 import random
 import logging
+from functools import cache, cached_property
 from packit_service.config import ServiceConfig
 from typing import Optional
 from ogr.services.forgejo.project import ForgejoProject
@@ -11,23 +12,45 @@ from ogr.abstract import GitProject
 
 logger = logging.getLogger(__name__)
 
+# placeholder versions don't need the shared module-level generator
+_random_version = random.Random().randrange
+
+
+@cache
+def get_forgejo_service() -> ForgejoService:
+    """
+    The Codeberg service is the same for all the handlers,
+    create it only once per worker process.
+    """
+    return ForgejoService(instance_url="https://codeberg.org")
+
 
 class ForgejoNewPrHandler(JobHandler):
     # task_name = TaskName.forgejo_new_pr
+    repo_name: Optional[str] = None
+    namespace: Optional[str] = None
 
-    @property
-    def service_config(self) -> Optional[ServiceConfig]:
+    @cached_property
+    def service_config(self) -> ServiceConfig:
         return ServiceConfig.get_service_config()
 
     @property
     def project(self) -> Optional[GitProject]:
-        if hasattr(self, 'repo_name') and hasattr(self, 'namespace') and self.repo_name and self.namespace:
-            return ForgejoProject(repo=str(self.repo_name), namespace=str(self.namespace), service=ForgejoService(instance_url="https://codeberg.org"))
-        return None
+        if not self._project and self.repo_name and self.namespace:
+            self._project = ForgejoProject(
+                repo=str(self.repo_name),
+                namespace=str(self.namespace),
+                service=get_forgejo_service(),
+            )
+        return self._project
+
+    @cached_property
+    def _event(self) -> dict:
+        return self.data.event_dict or {}
 
     def run(self):
         # Extract info from the event
-        event = getattr(self.data, 'event_dict', None)
+        event = self._event
         if not event:
             logger.warning("No event_dict found in self.data.")
             return TaskResults(success=False, details={"msg": "No event_dict found."})
@@ -37,9 +60,15 @@ class ForgejoNewPrHandler(JobHandler):
         self.namespace = event.get("target_repo_namespace")
         package_name = self.repo_name
         package_author = self.namespace
-        package_version = str(random.randint(1000, 9999))
-        logger.info(f"ForgejoNewPrHandler: repo_url={repo_url}, package_name={
-                    package_name}, package_author={package_author}, package_version={package_version}")
+        package_version = str(_random_version(1000, 10000))
+        logger.info(
+            "ForgejoNewPrHandler: repo_url=%s, package_name=%s, package_author=%s, "
+            "package_version=%s",
+            repo_url,
+            package_name,
+            package_author,
+            package_version,
+        )
         return TaskResults(
             success=True,
             details={
@@ -52,10 +81,7 @@ class ForgejoNewPrHandler(JobHandler):
         )
 
     def get_package_name(self) -> Optional[str]:
-        event = getattr(self.data, 'event_dict', None)
-        if event:
-            return event.get("target_repo_name")
-        return None
+        return self._event.get("target_repo_name")
 
     def clean_api(self):
         return None
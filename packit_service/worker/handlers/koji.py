@@ -110,7 +110,6 @@ class KojiBuildHandler(
         )
 
         # lazy property
-        self._koji_build_helper: Optional[KojiBuildJobHelper] = None
         self._project: Optional[GitProject] = None
 
     @staticmethod
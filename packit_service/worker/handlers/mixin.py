@@ -3,8 +3,10 @@
 
 import logging
 from abc import abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from functools import cached_property
+from operator import attrgetter
 from typing import Any, Optional, Protocol, Union
 
 from packit.config import JobConfig, PackageConfig
@@ -14,13 +16,7 @@ from packit.vm_image_build import ImageBuilder
 
 from packit_service.config import ProjectToSync
 from packit_service.constants import COPR_SRPM_CHROOT, KojiBuildState
-from packit_service.events import (
-    copr,
-    github,
-    gitlab,
-    koji,
-    pagure,
-)
+from packit_service.events import copr, koji
 from packit_service.events.event_data import EventData
 from packit_service.models import (
     BuildStatus,
@@ -35,6 +31,8 @@ from packit_service.worker.helpers.build.copr_build import CoprBuildJobHelper
 from packit_service.worker.helpers.build.koji_build import KojiBuildJobHelper
 from packit_service.worker.helpers.sidetag import Sidetag, SidetagHelper
 from packit_service.worker.helpers.testing_farm import (
+    COMMENT_EVENT_TYPES,
+    COPR_BUILD_COMMANDS,
     DownstreamTestingFarmJobHelper,
     TestingFarmJobHelper,
 )
@@ -53,15 +51,9 @@ class GetKojiBuildEvent(Protocol):
 
 
 class GetKojiBuildEventMixin(ConfigFromEventMixin, GetKojiBuildEvent):
-    _koji_build_event: Optional[koji.result.Build] = None
-
-    @property
+    @cached_property
     def koji_build_event(self):
-        if not self._koji_build_event:
-            self._koji_build_event = koji.result.Build.from_event_dict(
-                self.data.event_dict,
-            )
-        return self._koji_build_event
+        return koji.result.Build.from_event_dict(self.data.event_dict)
 
 
 class GetKojiTaskEvent(Protocol):
@@ -73,15 +65,11 @@ class GetKojiTaskEvent(Protocol):
 
 
 class GetKojiTaskEventMixin(ConfigFromEventMixin, GetKojiTaskEvent):
-    _koji_task_event: Optional[koji.result.Task] = None
-
-    @property
+    @cached_property
     def koji_task_event(self) -> Optional[koji.result.Task]:
-        if not self._koji_task_event and "task_id" in self.data.event_dict:
-            self._koji_task_event = koji.result.Task.from_event_dict(
-                self.data.event_dict,
-            )
-        return self._koji_task_event
+        if "task_id" not in self.data.event_dict:
+            return None
+        return koji.result.Task.from_event_dict(self.data.event_dict)
 
 
 class GetKojiBuild(Protocol):
@@ -95,33 +83,21 @@ class GetKojiBuild(Protocol):
 
 
 class GetKojiBuildFromTaskOrPullRequestMixin(GetKojiBuild, GetKojiTaskEventMixin):
-    _koji_build: Optional[KojiBuildTargetModel] = None
-    _db_project_event: Optional[ProjectEventModel] = None
-
-    @property
+    @cached_property
     def koji_build(self) -> Optional[KojiBuildTargetModel]:
-        if not self._koji_build:
-            if self.koji_task_event:
-                self._koji_build = KojiBuildTargetModel.get_by_task_id(
-                    str(self.koji_task_event.task_id)
-                )
-            else:
-                pull_request = self.project.get_pr(self.data.pr_id)
-                self._koji_build = (
-                    KojiBuildTargetModel.get_last_successful_scratch_by_commit_target(
-                        pull_request.head_commit, pull_request.target_branch
-                    )
-                )
-        return self._koji_build
+        # no need to parse the whole task event just for its ID
+        if (task_id := self.data.event_dict.get("task_id")) is not None:
+            return KojiBuildTargetModel.get_by_task_id(str(task_id))
+        pull_request = self.project.get_pr(self.data.pr_id)
+        return KojiBuildTargetModel.get_last_successful_scratch_by_commit_target(
+            pull_request.head_commit, pull_request.target_branch
+        )
 
-    @property
+    @cached_property
     def db_project_event(self) -> Optional[ProjectEventModel]:
-        if not self._db_project_event:
-            if self.koji_build:
-                self._db_project_event = self.koji_build.get_project_event_model()
-            else:
-                self._db_project_event = self.data.db_project_event
-        return self._db_project_event
+        if self.koji_build:
+            return self.koji_build.get_project_event_model()
+        return self.data.db_project_event
 
 
 class GetKojiBuildJobHelper(Protocol):
@@ -131,24 +107,21 @@ class GetKojiBuildJobHelper(Protocol):
 
 
 class GetKojiBuildJobHelperMixin(GetKojiBuildJobHelper, ConfigFromEventMixin):
-    _koji_build_helper: Optional[KojiBuildJobHelper] = None
     package_config: PackageConfig
     job_config: JobConfig
 
-    @property
+    @cached_property
     def koji_build_helper(self) -> KojiBuildJobHelper:
-        if not self._koji_build_helper:
-            self._koji_build_helper = KojiBuildJobHelper(
-                service_config=self.service_config,
-                package_config=self.package_config,
-                project=self.project,
-                metadata=self.data,
-                db_project_event=self.data.db_project_event,
-                job_config=self.job_config,
-                build_targets_override=self.data.build_targets_override,
-                tests_targets_override=self.data.tests_targets_override,
-            )
-        return self._koji_build_helper
+        return KojiBuildJobHelper(
+            service_config=self.service_config,
+            package_config=self.package_config,
+            project=self.project,
+            metadata=self.data,
+            db_project_event=self.data.db_project_event,
+            job_config=self.job_config,
+            build_targets_override=self.data.build_targets_override,
+            tests_targets_override=self.data.tests_targets_override,
+        )
 
 
 @dataclass
@@ -157,6 +130,9 @@ class KojiBuildData:
     a selected dist-git branch.
     """
 
+    # dataclass(slots=True) needs Python 3.10
+    __slots__ = ("build_id", "dist_git_branch", "nvr", "state", "task_id")
+
     dist_git_branch: str
     build_id: int
     nvr: str
@@ -164,40 +140,34 @@ class KojiBuildData:
     task_id: int
 
 
-class GetKojiBuildData(Iterator, Protocol):
+class GetKojiBuildData(Iterable, Protocol):
     """Get the Koji build data associated with
     the selected dist-git branch.
     """
 
     _branch_index: int = 0
 
-    def __iter__(self) -> Iterator[KojiBuildData]:
-        self._branch_index = 0
-        return self
-
     @property
     @abstractmethod
     def num_of_branches(self): ...
 
-    def __next__(self) -> KojiBuildData:
+    def __iter__(self) -> Iterator[KojiBuildData]:
         """Iterate over all available dist-git branches.
         Change internal pointer to the next dist-git branch.
 
-        Returns:
+        Yields:
             A new set of Koji Build Data associated
             with the next available dist_git_branch
         """
-        if self._branch_index < self.num_of_branches:
-            koji_build_data = KojiBuildData(
+        for branch_index in range(self.num_of_branches):
+            self._branch_index = branch_index
+            yield KojiBuildData(
                 dist_git_branch=self._dist_git_branch,
                 build_id=self._build_id,
                 nvr=self._nvr,
                 state=self._state,
                 task_id=self._task_id,
             )
-            self._branch_index += 1
-            return koji_build_data
-        raise StopIteration
 
     @property
     @abstractmethod
@@ -250,24 +220,13 @@ class GetKojiBuildDataFromKojiBuildTagEventMixin(
     ConfigFromEventMixin,
     GetKojiBuildData,
 ):
-    _koji_build_tag_event: Optional[koji.tag.Build] = None
-    _sidetag: Optional[Sidetag] = None
-
-    @property
+    @cached_property
     def koji_build_tag_event(self) -> koji.tag.Build:
-        if not self._koji_build_tag_event:
-            self._koji_build_tag_event = koji.tag.Build.from_event_dict(
-                self.data.event_dict,
-            )
-        return self._koji_build_tag_event
+        return koji.tag.Build.from_event_dict(self.data.event_dict)
 
-    @property
+    @cached_property
     def sidetag(self) -> Optional[Sidetag]:
-        if not self._sidetag:
-            self._sidetag = SidetagHelper.get_sidetag_by_koji_name(
-                self.koji_build_tag_event.tag_name,
-            )
-        return self._sidetag
+        return SidetagHelper.get_sidetag_by_koji_name(self.koji_build_tag_event.tag_name)
 
     @property
     def _nvr(self) -> str:
@@ -387,15 +346,9 @@ class GetCoprBuildEvent(Protocol):
 
 
 class GetCoprBuildEventMixin(ConfigFromEventMixin, GetCoprBuildEvent):
-    _copr_build_event: Optional[copr.CoprBuild] = None
-
-    @property
+    @cached_property
     def copr_event(self):
-        if not self._copr_build_event:
-            self._copr_build_event = copr.CoprBuild.from_event_dict(
-                self.data.event_dict,
-            )
-        return self._copr_build_event
+        return copr.CoprBuild.from_event_dict(self.data.event_dict)
 
 
 class GetSRPMBuild(Protocol):
@@ -409,27 +362,20 @@ class GetSRPMBuild(Protocol):
 
 
 class GetCoprSRPMBuildMixin(GetSRPMBuild, GetCoprBuildEventMixin):
-    _build: Optional[Union[CoprBuildTargetModel, SRPMBuildModel]] = None
-    _db_project_event: Optional[ProjectEventModel] = None
-
-    @property
-    def build(self):
-        if not self._build:
-            build_id = str(self.copr_event.build_id)
-            if self.copr_event.chroot == COPR_SRPM_CHROOT:
-                self._build = SRPMBuildModel.get_by_copr_build_id(build_id)
-            else:
-                self._build = CoprBuildTargetModel.get_by_build_id(
-                    build_id,
-                    self.copr_event.chroot,
-                )
-        return self._build
-
-    @property
+    @cached_property
+    def build(self) -> Optional[Union[CoprBuildTargetModel, SRPMBuildModel]]:
+        copr_event = self.copr_event
+        build_id = str(copr_event.build_id)
+        if copr_event.chroot == COPR_SRPM_CHROOT:
+            return self._get_srpm_build(build_id)
+        return CoprBuildTargetModel.get_by_build_id(build_id, copr_event.chroot)
+
+    def _get_srpm_build(self, copr_build_id: str) -> Optional[SRPMBuildModel]:
+        return SRPMBuildModel.get_by_copr_build_id(copr_build_id)
+
+    @cached_property
     def db_project_event(self) -> Optional[ProjectEventModel]:
-        if not self._db_project_event:
-            self._db_project_event = self.build.get_project_event_model()
-        return self._db_project_event
+        return self.build.get_project_event_model()
 
 
 class GetCoprBuild(Protocol):
@@ -441,20 +387,13 @@ class GetCoprBuild(Protocol):
 
 
 class GetCoprBuildMixin(GetCoprBuild, ConfigFromEventMixin):
-    _build: Optional[CoprBuildTargetModel] = None
-    _db_project_event: Optional[ProjectEventModel] = None
-
-    @property
+    @cached_property
     def db_project_event(self) -> Optional[ProjectEventModel]:
-        if not self._db_project_event:
-            # copr build end
-            if self.build_id:
-                build = CoprBuildTargetModel.get_by_id(self.build_id)
-                self._db_project_event = build.get_project_event_model()
-            # other events
-            else:
-                self._db_project_event = self.data.db_project_event
-        return self._db_project_event
+        # copr build end
+        if self.build_id:
+            return CoprBuildTargetModel.get_project_event_by_build_id(self.build_id)
+        # other events
+        return self.data.db_project_event
 
 
 class GetCoprBuildJobHelper(Protocol):
@@ -469,24 +408,20 @@ class GetCoprBuildJobHelper(Protocol):
 
 
 class GetCoprBuildJobHelperMixin(Config, GetCoprBuildJobHelper):
-    _copr_build_helper: Optional[CoprBuildJobHelper] = None
-
-    @property
+    @cached_property
     def copr_build_helper(self) -> CoprBuildJobHelper:
-        if not self._copr_build_helper:
-            self._copr_build_helper = CoprBuildJobHelper(
-                service_config=self.service_config,
-                package_config=self.package_config,
-                project=self.project,
-                metadata=self.data,
-                db_project_event=self.data.db_project_event,
-                job_config=self.job_config,
-                build_targets_override=self.data.build_targets_override,
-                tests_targets_override=self.data.tests_targets_override,
-                pushgateway=self.pushgateway,
-                celery_task=self.celery_task,
-            )
-        return self._copr_build_helper
+        return CoprBuildJobHelper(
+            service_config=self.service_config,
+            package_config=self.package_config,
+            project=self.project,
+            metadata=self.data,
+            db_project_event=self.data.db_project_event,
+            job_config=self.job_config,
+            build_targets_override=self.data.build_targets_override,
+            tests_targets_override=self.data.tests_targets_override,
+            pushgateway=self.pushgateway,
+            celery_task=self.celery_task,
+        )
 
 
 class GetCoprBuildJobHelperForIdMixin(
@@ -494,33 +429,36 @@ class GetCoprBuildJobHelperForIdMixin(
     GetCoprSRPMBuildMixin,
     ConfigFromEventMixin,
 ):
-    _copr_build_helper: Optional[CoprBuildJobHelper] = None
+    @cached_property
+    def _srpm_build_and_targets(
+        self,
+    ) -> tuple[Optional[SRPMBuildModel], list[CoprBuildTargetModel]]:
+        return CoprBuildTargetModel.get_build_and_targets_by_copr_build_id(
+            str(self.copr_event.build_id),
+        )
 
-    @property
+    def _get_srpm_build(self, copr_build_id: str) -> Optional[SRPMBuildModel]:
+        # fetched in one go with the RPM build targets
+        return self._srpm_build_and_targets[0]
+
+    @cached_property
     def copr_build_helper(self) -> CoprBuildJobHelper:
         # when reporting state of SRPM build built in Copr
         build_targets_override = (
-            {
-                (build.target, build.identifier)
-                for build in CoprBuildTargetModel.get_all_by_build_id(
-                    str(self.copr_event.build_id),
-                )
-            }
+            {(build.target, build.identifier) for build in self._srpm_build_and_targets[1]}
             if self.copr_event.chroot == COPR_SRPM_CHROOT
             else None
         )
-        if not self._copr_build_helper:
-            self._copr_build_helper = CoprBuildJobHelper(
-                service_config=self.service_config,
-                package_config=self.package_config,
-                project=self.project,
-                metadata=self.data,
-                db_project_event=self.db_project_event,
-                job_config=self.job_config,
-                pushgateway=self.pushgateway,
-                build_targets_override=build_targets_override,
-            )
-        return self._copr_build_helper
+        return CoprBuildJobHelper(
+            service_config=self.service_config,
+            package_config=self.package_config,
+            project=self.project,
+            metadata=self.data,
+            db_project_event=self.db_project_event,
+            job_config=self.job_config,
+            pushgateway=self.pushgateway,
+            build_targets_override=build_targets_override,
+        )
 
 
 class GetTestingFarmJobHelper(Protocol):
@@ -538,23 +476,19 @@ class GetTestingFarmJobHelperMixin(
     GetCoprBuildMixin,
     ConfigFromEventMixin,
 ):
-    _testing_farm_job_helper: Optional[TestingFarmJobHelper] = None
-
-    @property
+    @cached_property
     def testing_farm_job_helper(self) -> TestingFarmJobHelper:
-        if not self._testing_farm_job_helper:
-            self._testing_farm_job_helper = TestingFarmJobHelper(
-                service_config=self.service_config,
-                package_config=self.package_config,
-                project=self.project,
-                metadata=self.data,
-                db_project_event=self.db_project_event,
-                job_config=self.job_config,
-                build_targets_override=self.data.build_targets_override,
-                tests_targets_override=self.data.tests_targets_override,
-                celery_task=self.celery_task,
-            )
-        return self._testing_farm_job_helper
+        return TestingFarmJobHelper(
+            service_config=self.service_config,
+            package_config=self.package_config,
+            project=self.project,
+            metadata=self.data,
+            db_project_event=self.db_project_event,
+            job_config=self.job_config,
+            build_targets_override=self.data.build_targets_override,
+            tests_targets_override=self.data.tests_targets_override,
+            celery_task=self.celery_task,
+        )
 
 
 class GetDownstreamTestingFarmJobHelper(Protocol):
@@ -570,19 +504,15 @@ class GetDownstreamTestingFarmJobHelperMixin(
     GetKojiBuildFromTaskOrPullRequestMixin,
     ConfigFromEventMixin,
 ):
-    _downstream_testing_farm_job_helper: Optional[DownstreamTestingFarmJobHelper] = None
-
-    @property
+    @cached_property
     def downstream_testing_farm_job_helper(self) -> DownstreamTestingFarmJobHelper:
-        if not self._downstream_testing_farm_job_helper:
-            self._downstream_testing_farm_job_helper = DownstreamTestingFarmJobHelper(
-                service_config=self.service_config,
-                project=self.project,
-                metadata=self.data,
-                koji_build=self.koji_build,
-                celery_task=self.celery_task,
-            )
-        return self._downstream_testing_farm_job_helper
+        return DownstreamTestingFarmJobHelper(
+            service_config=self.service_config,
+            project=self.project,
+            metadata=self.data,
+            koji_build=self.koji_build,
+            celery_task=self.celery_task,
+        )
 
 
 class GetGithubCommentEvent(Protocol):
@@ -594,18 +524,26 @@ class GetGithubCommentEvent(Protocol):
 
 
 class GetGithubCommentEventMixin(GetGithubCommentEvent, ConfigFromEventMixin):
+    @cached_property
+    def _comment_command_prefix(self) -> str:
+        return self.service_config.comment_command_prefix
+
     def is_comment_event(self) -> bool:
-        return self.data.event_type in (
-            github.pr.Comment.event_type(),
-            gitlab.mr.Comment.event_type(),
-            pagure.pr.Comment.event_type(),
-        )
+        return self.data.event_type in COMMENT_EVENT_TYPES
 
     def is_copr_build_comment_event(self) -> bool:
-        return self.is_comment_event() and get_packit_commands_from_comment(
-            self.data.event_dict.get("comment"),
-            packit_comment_command_prefix=self.service_config.comment_command_prefix,
-        )[0] in ("build", "copr-build")
+        if not self.is_comment_event():
+            return False
+        comment = self.data.event_dict.get("comment") or ""
+        prefix = self._comment_command_prefix
+        # most comments are not addressed to us, skip parsing those
+        if prefix not in comment:
+            return False
+        commands = get_packit_commands_from_comment(
+            comment,
+            packit_comment_command_prefix=prefix,
+        )
+        return bool(commands) and commands[0] in COPR_BUILD_COMMANDS
 
 
 class GetProjectToSync(Protocol):
@@ -623,8 +561,6 @@ class GetProjectToSync(Protocol):
 
 
 class GetProjectToSyncMixin(ConfigFromEventMixin, GetProjectToSync):
-    _project_to_sync: Optional[ProjectToSync] = None
-
     @property
     def dg_repo_name(self) -> str:
         return self.data.event_dict.get("repo_name")
@@ -633,16 +569,12 @@ class GetProjectToSyncMixin(ConfigFromEventMixin, GetProjectToSync):
     def dg_branch(self) -> str:
         return self.data.event_dict.get("git_ref")
 
-    @property
+    @cached_property
     def project_to_sync(self) -> Optional[ProjectToSync]:
-        if self._project_to_sync is None and (
-            project_to_sync := self.service_config.get_project_to_sync(
-                dg_repo_name=self.dg_repo_name,
-                dg_branch=self.dg_branch,
-            )
-        ):
-            self._project_to_sync = project_to_sync
-        return self._project_to_sync
+        return self.service_config.get_project_to_sync(
+            dg_repo_name=self.dg_repo_name,
+            dg_branch=self.dg_branch,
+        )
 
 
 class GetVMImageBuilder(Protocol):
@@ -699,16 +631,9 @@ class GetVMImageBuilderMixin(Config):
 
 class GetVMImageDataMixin(Config, GetCoprBuildJobHelper):
     job_config: JobConfig
-    _copr_build: Optional[CoprBuildTargetModel] = None
-    _copr_build_helper: Optional[CoprBuildJobHelper] = None
-
-    @property
-    def chroot(self) -> str:
-        return self.job_config.copr_chroot
 
-    @property
-    def identifier(self) -> str:
-        return self.job_config.identifier
+    chroot = property(attrgetter("job_config.copr_chroot"))
+    identifier = property(attrgetter("job_config.identifier"))
 
     @property
     def owner(self) -> str:
@@ -724,33 +649,22 @@ class GetVMImageDataMixin(Config, GetCoprBuildJobHelper):
     def image_name(self) -> str:
         return f"{self.owner}/{self.project_name}/{self.data.pr_id}"
 
-    @property
-    def image_distribution(self) -> str:
-        return self.job_config.image_distribution
-
-    @property
-    def image_request(self) -> dict:
-        return self.job_config.image_request
-
-    @property
-    def image_customizations(self) -> dict:
-        return self.job_config.image_customizations
+    image_distribution = property(attrgetter("job_config.image_distribution"))
+    image_request = property(attrgetter("job_config.image_request"))
+    image_customizations = property(attrgetter("job_config.image_customizations"))
 
-    @property
+    @cached_property
     def copr_build(self) -> Optional[CoprBuildTargetModel]:
-        if not self._copr_build:
-            copr_builds = CoprBuildTargetModel.get_all_by(
-                project_name=self.job_config.project or self.copr_build_helper.default_project_name,
-                commit_sha=self.data.commit_sha,
-                owner=self.job_config.owner or self.copr_build_helper.job_owner,
-                target=self.job_config.copr_chroot,
-                status=BuildStatus.success,
-            )
-
-            for copr_build in copr_builds:
-                project_event_object = copr_build.get_project_event_object()
-                # check whether the event trigger matches
-                if project_event_object.id == self.data.db_project_object.id:
-                    self._copr_build = copr_build
-                    break
-        return self._copr_build
+        if not (db_project_object := self.data.db_project_object):
+            return None
+
+        copr_builds = CoprBuildTargetModel.get_all_by(
+            project_name=self.job_config.project or self.copr_build_helper.default_project_name,
+            commit_sha=self.data.commit_sha,
+            owner=self.job_config.owner or self.copr_build_helper.job_owner,
+            target=self.job_config.copr_chroot,
+            status=BuildStatus.success,
+            # check whether the event trigger matches
+            project_event_object_id=db_project_object.id,
+        )
+        return next(iter(copr_builds), None)
@@ -8,6 +8,7 @@ This file defines classes for job handlers specific for Testing farm
 import logging
 import os
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import Optional
 
 from celery import Task
@@ -70,10 +71,7 @@ from packit_service.worker.handlers.mixin import (
     GetGithubCommentEventMixin,
     GetTestingFarmJobHelperMixin,
 )
-from packit_service.worker.helpers.testing_farm import (
-    DownstreamTestingFarmJobHelper,
-    TestingFarmJobHelper,
-)
+from packit_service.worker.helpers.testing_farm import DownstreamTestingFarmJobHelper
 from packit_service.worker.mixin import PackitAPIWithDownstreamMixin
 from packit_service.worker.reporting import BaseCommitStatus
 from packit_service.worker.result import TaskResults
@@ -131,7 +129,6 @@ class TestingFarmHandler(
         )
         self.build_id = build_id
         self._testing_farm_target_id = testing_farm_target_id
-        self._testing_farm_job_helper: Optional[TestingFarmJobHelper] = None
 
     @staticmethod
     def get_checkers() -> tuple[type[Checker], ...]:
@@ -519,15 +516,12 @@ class TestingFarmResultsHandler(
     def get_checkers() -> tuple[type[Checker], ...]:
         return (IsEventForJob,)
 
-    @property
+    @cached_property
     def db_project_event(self) -> Optional[ProjectEventModel]:
-        if not self._db_project_event:
-            run_model = TFTTestRunTargetModel.get_by_pipeline_id(
-                pipeline_id=self.pipeline_id,
-            )
-            if run_model:
-                self._db_project_event = run_model.get_project_event_model()
-        return self._db_project_event
+        run_model = TFTTestRunTargetModel.get_by_pipeline_id(
+            pipeline_id=self.pipeline_id,
+        )
+        return run_model.get_project_event_model() if run_model else None
 
     def run(self) -> TaskResults:
         logger.debug(f"Testing farm {self.pipeline_id} result:\n{self.result}")
@@ -626,15 +620,12 @@ class DownstreamTestingFarmResultsHandler(
         self.summary = event.get("summary")
         self.created = event.get("created")
 
-    @property
+    @cached_property
     def db_project_event(self) -> Optional[ProjectEventModel]:
-        if not self._db_project_event:
-            run_model = TFTTestRunTargetModel.get_by_pipeline_id(
-                pipeline_id=self.pipeline_id,
-            )
-            if run_model:
-                self._db_project_event = run_model.get_project_event_model()
-        return self._db_project_event
+        run_model = TFTTestRunTargetModel.get_by_pipeline_id(
+            pipeline_id=self.pipeline_id,
+        )
+        return run_model.get_project_event_model() if run_model else None
 
     def run(self) -> TaskResults:
         logger.debug(f"Testing farm {self.pipeline_id} result:\n{self.result}")
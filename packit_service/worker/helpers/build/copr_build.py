@@ -100,6 +100,7 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
         )
         self.celery_task = celery_task
         self._copr_build_group_id = copr_build_group_id
+        self._custom_copr_can_be_used: Optional[bool] = None
 
     @property
     def msg_retrigger(self) -> str:
@@ -416,8 +417,16 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
         There will be a better integration in form of
         a new config field in Copr settings that Packit can use.
 
+        The result is cached on the helper so that the Copr API is queried
+        (and the failure reported) only once.
+
         :return: True if the matching is configured.
         """
+        if self._custom_copr_can_be_used is None:
+            self._custom_copr_can_be_used = self._check_if_custom_copr_can_be_used_and_report()
+        return self._custom_copr_can_be_used
+
+    def _check_if_custom_copr_can_be_used_and_report(self) -> bool:
         if self.is_forge_project_allowed_to_build_in_copr():
             return True
 
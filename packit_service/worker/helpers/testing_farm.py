@@ -48,6 +48,16 @@ from packit_service.worker.result import TaskResults
 
 logger = logging.getLogger(__name__)
 
+COMMENT_EVENT_TYPES = frozenset(
+    {
+        github.pr.Comment.event_type(),
+        gitlab.mr.Comment.event_type(),
+        pagure.pr.Comment.event_type(),
+    }
+)
+COPR_BUILD_COMMANDS = frozenset({"build", "copr-build"})
+TEST_COMMANDS = frozenset({"test", "retest-failed"})
+
 
 class CommentArguments:
     """
@@ -295,23 +305,15 @@ class TestingFarmJobHelper(CoprBuildJobHelper):
         return self._comment_arguments
 
     def is_comment_event(self) -> bool:
-        return self.metadata.event_type in (
-            github.pr.Comment.event_type(),
-            gitlab.mr.Comment.event_type(),
-            pagure.pr.Comment.event_type(),
-        )
+        return self.metadata.event_type in COMMENT_EVENT_TYPES
 
     def is_copr_build_comment_event(self) -> bool:
-        return self.is_comment_event() and self.comment_arguments.packit_command in (
-            "build",
-            "copr-build",
+        return (
+            self.is_comment_event() and self.comment_arguments.packit_command in COPR_BUILD_COMMANDS
         )
 
     def is_test_comment_event(self) -> bool:
-        return self.is_comment_event() and self.comment_arguments.packit_command in (
-            "test",
-            "retest-failed",
-        )
+        return self.is_comment_event() and self.comment_arguments.packit_command in TEST_COMMANDS
 
     def is_test_comment_pr_argument_present(self):
         return self.is_test_comment_event() and self.comment_arguments.pr_argument
@@ -1298,15 +1300,9 @@ class DownstreamTestingFarmJobHelper:
         ]
         if metadata.event_type != pagure.pr.Comment.event_type():
             return all_tests
-        # TODO: remove this once Fedora CI has its own instances and comment_command_prefixes
-        # comment_command_prefixes for Fedora CI are /packit-ci and /packit-ci-stg
-        comment_command_prefix = (
-            "/packit-ci-stg"
-            if service_config.comment_command_prefix.endswith("-stg")
-            else "/packit-ci"
-        )
         commands = get_packit_commands_from_comment(
-            metadata.event_dict.get("comment"), comment_command_prefix
+            metadata.event_dict.get("comment"),
+            service_config.fedora_ci_comment_command_prefix,
         )
         if not commands:
             return []
@@ -6,9 +6,9 @@ We love you, Steve Jobs.
 """
 
 import logging
+import re
 from datetime import datetime
-from functools import cached_property
-from re import match
+from functools import cache, cached_property
 from typing import Callable, Optional, Union
 
 import celery
@@ -79,8 +79,97 @@ from packit_service.worker.result import TaskResults
 logger = logging.getLogger(__name__)
 
 
-MANUAL_OR_RESULT_EVENTS = [
-    abstract.comment.CommentEvent, abstract.base.Result, github.check.Rerun]
+# fields of the package description in the body of a Forgejo PR,
+# in the order of priority when there are more of them on one line
+FORGEJO_PR_FIELDS = {
+    "Package Name": "package_name",
+    # kept for backward compatibility
+    "package_name": "package_name",
+    "Version": "package_version",
+    "Description": "package_description",
+    "FAS username": "fas_username",
+    "License": "package_license",
+}
+# one alternative (with its own value group) per field in the order of priority,
+# so the field set by a line is given by the index of the group that matched
+FORGEJO_PR_FIELD_RE = re.compile(
+    "^(?:{})$".format("|".join(rf".*?{re.escape(name)}:(.*)" for name in FORGEJO_PR_FIELDS)),
+    re.MULTILINE,
+)
+FORGEJO_PR_FIELD_BY_GROUP = (None, *FORGEJO_PR_FIELDS.values())
+
+# dist-git repository URL in the description of an issue in the issues repository
+DISTGIT_ISSUE_RE = re.compile(r"[\w\s-]+dist-git \((\S+)\):")
+
+MANUAL_OR_RESULT_EVENTS = (
+    abstract.comment.CommentEvent, abstract.base.Result, github.check.Rerun)
+
+# events that can trigger Fedora CI jobs
+FEDORA_CI_EVENTS = (pagure.pr.Action, pagure.pr.Comment, koji.result.Task, testing_farm.Result)
+
+# handlers re-triggered by a comment in dist-git that are reported via comments
+DOWNSTREAM_RETRIGGER_HANDLERS = frozenset(
+    {
+        PullFromUpstreamHandler,
+        DownstreamKojiBuildHandler,
+        BodhiUpdateHandler,
+        RetriggerBodhiUpdateHandler,
+        RetriggerDownstreamKojiBuildHandler,
+        TagIntoSidetagHandler,
+    },
+)
+
+# handlers that report the accepted task via statuses
+STATUS_REPORTING_HANDLERS = frozenset(
+    {
+        CoprBuildHandler,
+        KojiBuildHandler,
+        TestingFarmHandler,
+        ProposeDownstreamHandler,
+    },
+)
+
+# job helpers used for reporting the accepted tasks of STATUS_REPORTING_HANDLERS
+JOB_HELPER_FOR_HANDLER: dict[
+    type[JobHandler],
+    type[Union[ProposeDownstreamJobHelper, BaseBuildJobHelper]],
+] = {
+    CoprBuildHandler: CoprBuildJobHelper,
+    KojiBuildHandler: KojiBuildJobHelper,
+    TestingFarmHandler: TestingFarmJobHelper,
+    ProposeDownstreamHandler: ProposeDownstreamJobHelper,
+}
+
+# handlers starting a pipeline that stores the packages config in DB
+PACKAGES_CONFIG_STORING_HANDLERS = frozenset(
+    {
+        CoprBuildHandler,
+        KojiBuildHandler,
+        TestingFarmHandler,
+    },
+)
+
+
+def get_forgejo_pr_fields(body: str) -> dict[str, str]:
+    """
+    Get the fields of the package description in the body of a Forgejo PR.
+
+    Each line sets at most one field, the one with the highest priority
+    in `FORGEJO_PR_FIELDS`, to the rest of the line after the field name.
+    Later lines win, but an empty package name doesn't override an earlier one.
+
+    Args:
+        body: body of the PR
+
+    Returns:
+        Dictionary of the fields found in the body.
+    """
+    fields = {}
+    for m in FORGEJO_PR_FIELD_RE.finditer(body):
+        field, value = FORGEJO_PR_FIELD_BY_GROUP[m.lastindex], m[m.lastindex].strip()
+        if value or field != "package_name":
+            fields[field] = value
+    return fields
 
 
 def get_handlers_for_comment(
@@ -97,8 +186,21 @@ def get_handlers_for_comment(
     Returns:
         Set of handlers that are triggered by a comment.
     """
-    commands = get_packit_commands_from_comment(
-        comment, packit_comment_command_prefix)
+    return get_handlers_for_commands(
+        get_packit_commands_from_comment(comment, packit_comment_command_prefix),
+    )
+
+
+def get_handlers_for_commands(commands: list[str]) -> set[type[JobHandler]]:
+    """
+    Get handlers for the already parsed Packit commands from a comment.
+
+    Args:
+        commands: Packit command and its arguments, without the prefix
+
+    Returns:
+        Set of handlers that are triggered by the command.
+    """
     if not commands:
         return set()
 
@@ -122,13 +224,6 @@ def get_handlers_for_comment_fedora_ci(
     Returns:
         Set of handlers that are triggered by a comment.
     """
-    # TODO: remove this once Fedora CI has its own instances and comment_command_prefixes
-    # comment_command_prefixes for Fedora CI are /packit-ci and /packit-ci-stg
-    if packit_comment_command_prefix.endswith("-stg"):
-        packit_comment_command_prefix = "/packit-ci-stg"
-    else:
-        packit_comment_command_prefix = "/packit-ci"
-
     commands = get_packit_commands_from_comment(
         comment, packit_comment_command_prefix)
     if not commands:
@@ -140,6 +235,63 @@ def get_handlers_for_comment_fedora_ci(
     return handlers
 
 
+@cache
+def get_fedora_ci_handlers_for_event_type(
+        event_type: type[Event],
+) -> frozenset[type[FedoraCIJobHandler]]:
+    """
+    Get Fedora CI handlers reacting to the given type of event.
+
+    Handlers are registered when their modules are imported, so the result
+    for an event type doesn't change and can be cached.
+
+    Args:
+        event_type: class of the event we are reacting to
+
+    Returns:
+        Set of Fedora CI handlers that react to the event type.
+    """
+    return frozenset(
+        handler
+        for handler, supported_events in SUPPORTED_EVENTS_FOR_HANDLER_FEDORA_CI.items()
+        if issubclass(event_type, tuple(supported_events))
+    )
+
+
+@cache
+def get_supported_events_for_handler(handler: type[JobHandler]) -> tuple[type[Event], ...]:
+    """
+    Get events supported by the given handler as a tuple usable in `isinstance`.
+
+    Handlers are registered when their modules are imported, so the result
+    for a handler doesn't change and can be cached.
+
+    Args:
+        handler: handler class
+
+    Returns:
+        Tuple of event classes the handler reacts to.
+    """
+    return tuple(SUPPORTED_EVENTS_FOR_HANDLER[handler])
+
+
+@cache
+def get_handlers_for_job_type(job_type: JobType) -> frozenset[type[JobHandler]]:
+    """
+    Get handlers that run the given type of job or that are required by it.
+
+    Handlers are registered when their modules are imported, so the result
+    for a job type doesn't change and can be cached.
+
+    Args:
+        job_type: type of the job from the package config
+
+    Returns:
+        Set of handlers relevant to the job type.
+    """
+    return frozenset(MAP_JOB_TYPE_TO_HANDLER[job_type] | MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job_type])
+
+
 def get_handlers_for_check_rerun(check_name_job: str) -> set[type[JobHandler]]:
     """
     Get handlers for the given check name.
@@ -172,6 +324,34 @@ class SteveJobs:
     def service_config(self) -> ServiceConfig:
         return ServiceConfig.get_service_config()
 
+    @cached_property
+    def event_data(self) -> EventData:
+        """
+        Event data shared by the job helpers used for reporting the accepted tasks.
+
+        The event is loaded with its packages config at that point and doesn't
+        change while the tasks are being created, so it is serialized only once.
+        """
+        return EventData.from_event_dict(self.event.get_dict())
+
+    @cached_property
+    def comment_commands(self) -> list[str]:
+        """
+        Packit commands from the comment of a comment event, parsed only once
+        for all the places that need them.
+        """
+        if not isinstance(self.event, abstract.comment.CommentEvent):
+            return []
+        return get_packit_commands_from_comment(
+            self.event.comment,
+            self.service_config.comment_command_prefix,
+        )
+
+    @cached_property
+    def handlers_for_comment(self) -> set[type[JobHandler]]:
+        """Handlers triggered by the Packit command in the comment."""
+        return get_handlers_for_commands(self.comment_commands)
+
     @classmethod
     def process_message(
             cls,
@@ -201,16 +381,17 @@ class SteveJobs:
         event_object: Optional[Event] = parser(event)
         steve = cls(event_object)
         steve.pushgateway.events_processed.inc()
-        if event_not_handled := not event_object:
-            steve.pushgateway.events_not_handled.inc()
-        elif pre_check_failed := not event_object.pre_check():
-            steve.pushgateway.events_pre_check_failed.inc()
-
-        result = [] if (
-            event_not_handled or pre_check_failed) else steve.process()
-
-        steve.pushgateway.push()
-        return result
+        # the metrics are only collected while processing the event
+        # and pushed to the gateway at once, even if the processing fails
+        try:
+            if event_not_handled := not event_object:
+                steve.pushgateway.events_not_handled.inc()
+            elif pre_check_failed := not event_object.pre_check():
+                steve.pushgateway.events_pre_check_failed.inc()
+
+            return [] if (event_not_handled or pre_check_failed) else steve.process()
+        finally:
+            steve.pushgateway.push()
 
     def process(self) -> list[TaskResults]:
         """
@@ -223,13 +404,7 @@ class SteveJobs:
         """
         processing_results = None
 
-        if (
-                isinstance(
-                    self.event,
-                    (pagure.pr.Action, pagure.pr.Comment,
-                     koji.result.Task, testing_farm.Result),
-                )
-        ):
+        if isinstance(self.event, FEDORA_CI_EVENTS):
             # try to process Fedora CI jobs first
             processing_results = self.process_fedora_ci_jobs()
 
@@ -273,33 +448,18 @@ class SteveJobs:
                 else None
             ),
             "project": self.event.project,
-            "metadata": EventData.from_event_dict(self.event.get_dict()),
+            "metadata": self.event_data,
             "db_project_event": self.event.db_project_event,
             "job_config": job_config,
         }
 
         if handler_kls == ProposeDownstreamHandler:
-            propose_downstream_helper = ProposeDownstreamJobHelper
             params["branches_override"] = self.event.branches_override
-            return propose_downstream_helper(**params)
-
-        helper_kls: type[Union[TestingFarmJobHelper,
-                               CoprBuildJobHelper, KojiBuildJobHelper]]
-
-        if handler_kls == TestingFarmHandler:
-            helper_kls = TestingFarmJobHelper
-        elif handler_kls == CoprBuildHandler:
-            helper_kls = CoprBuildJobHelper
         else:
-            helper_kls = KojiBuildJobHelper
+            params["build_targets_override"] = self.event.build_targets_override
+            params["tests_targets_override"] = self.event.tests_targets_override
 
-        params.update(
-            {
-                "build_targets_override": self.event.build_targets_override,
-                "tests_targets_override": self.event.tests_targets_override,
-            },
-        )
-        return helper_kls(**params)
+        return JOB_HELPER_FOR_HANDLER[handler_kls](**params)
 
     def report_task_accepted(
             self,
@@ -319,22 +479,13 @@ class SteveJobs:
                 status has been updated.
         """
         number_of_build_targets = None
-        if isinstance(self.event, abstract.comment.CommentEvent) and handler_kls in (
-                PullFromUpstreamHandler,
-                DownstreamKojiBuildHandler,
-                BodhiUpdateHandler,
-                RetriggerBodhiUpdateHandler,
-                RetriggerDownstreamKojiBuildHandler,
-                TagIntoSidetagHandler,
+        if (
+                isinstance(self.event, abstract.comment.CommentEvent)
+                and handler_kls in DOWNSTREAM_RETRIGGER_HANDLERS
         ):
             self.report_task_accepted_for_downstream_retrigger_comments(
                 handler_kls)
-        if handler_kls not in (
-                CoprBuildHandler,
-                KojiBuildHandler,
-                TestingFarmHandler,
-                ProposeDownstreamHandler,
-        ):
+        if handler_kls not in STATUS_REPORTING_HANDLERS:
             # no reporting, no metrics
             return
 
@@ -352,10 +503,18 @@ class SteveJobs:
 
         self.push_copr_metrics(handler_kls, number_of_build_targets)
 
-    def report_task_accepted_for_fedora_ci(self, handler_kls: type[FedoraCIJobHandler]):
+    def report_task_accepted_for_fedora_ci(
+            self,
+            handler_kls: type[FedoraCIJobHandler],
+            event_dict: dict,
+    ):
         """
         For CI-related dist-git PR comment events report the initial status
         "Task was accepted" to inform user we are working on the request.
+
+        Args:
+            handler_kls: The class for the Handler that will be used.
+            event_dict: Serialized event the task is created for.
         """
         
         if not isinstance(
@@ -367,7 +526,7 @@ class SteveJobs:
             )
             return
 
-        metadata = EventData.from_event_dict(self.event.get_dict())
+        metadata = EventData.from_event_dict(event_dict)
 
         helper = FedoraCIHelper(
             project=self.event.project,
@@ -408,7 +567,7 @@ class SteveJobs:
             return None
 
         issue = self.event.project.get_issue(self.event.issue_id)
-        if m := match(r"[\w\s-]+dist-git \((\S+)\):", issue.description):
+        if m := DISTGIT_ISSUE_RE.match(issue.description):
             url = m[1]
             project = self.service_config.get_project(url=url)
             package_config = PackageConfigGetter.get_package_config_from_repo(
@@ -428,44 +587,14 @@ class SteveJobs:
         Returns:
             Whether the Packit configuration is present in the repo.
         """
+        package_name = specfile_path = None
         # Handle Forgejo events first, regardless of whether they're comment events
         if isinstance(self.event, forgejo.pr.Comment) or isinstance(self.event, forgejo.pr.Action):
             logging.debug(f"Processing Forgejo PR event")
 
-            comment_lines = self.event.body.strip().split('\n')
-            for line in comment_lines:
-                line = line.strip()
-                if 'Package Name:' in line:
-                    parts = line.split('Package Name:', 1)
-                    if len(parts) == 2:
-                        extracted_name = parts[1].strip()
-                        if extracted_name:
-                            package_name = extracted_name
-                            specfile_path = f"{extracted_name}.spec"
-                elif 'package_name:' in line:
-                    # Keep backward compatibility
-                    parts = line.split('package_name:', 1)
-                    if len(parts) == 2:
-                        extracted_name = parts[1].strip()
-                        if extracted_name:
-                            package_name = extracted_name
-                            specfile_path = f"{extracted_name}.spec"
-                elif 'Version:' in line:
-                    parts = line.split('Version:', 1)
-                    if len(parts) == 2:
-                        package_version = parts[1].strip()
-                elif 'Description:' in line:
-                    parts = line.split('Description:', 1)
-                    if len(parts) == 2:
-                        package_description = parts[1].strip()
-                elif 'FAS username:' in line:
-                    parts = line.split('FAS username:', 1)
-                    if len(parts) == 2:
-                        fas_username = parts[1].strip()
-                elif 'License:' in line:
-                    parts = line.split('License:', 1)
-                    if len(parts) == 2:
-                        package_license = parts[1].strip()
+            package_name = get_forgejo_pr_fields(self.event.body).get("package_name")
+            if package_name:
+                specfile_path = f"{package_name}.spec"
 
         # Create common package config (will use defaults if no comment parsing occurred)
         common_package_config = CommonPackageConfig(
@@ -498,10 +627,7 @@ class SteveJobs:
         return True
 
         if isinstance(self.event, abstract.comment.CommentEvent) and (
-                handlers := get_handlers_for_comment(
-                    self.event.comment,
-                    packit_comment_command_prefix=self.service_config.comment_command_prefix,
-                )
+                handlers := self.handlers_for_comment
         ):
             # we require packit config file when event is triggered by /packit command
             # but not when it is triggered through an issue in the issues repository
@@ -538,15 +664,12 @@ class SteveJobs:
         if isinstance(self.event, abstract.comment.CommentEvent):
             handlers_triggered_by_job = get_handlers_for_comment_fedora_ci(
                 self.event.comment,
-                self.service_config.comment_command_prefix,
+                self.service_config.fedora_ci_comment_command_prefix,
             )
 
-        matching_handlers = {
-            handler
-            for handler, supported_events in SUPPORTED_EVENTS_FOR_HANDLER_FEDORA_CI.items()
-            if isinstance(self.event, tuple(supported_events))
-            and (handlers_triggered_by_job is None or handler in handlers_triggered_by_job)
-        }
+        matching_handlers = get_fedora_ci_handlers_for_event_type(type(self.event))
+        if handlers_triggered_by_job is not None:
+            matching_handlers = matching_handlers & handlers_triggered_by_job
 
         if not matching_handlers:
             logger.debug(f"No handler found for event {
@@ -556,39 +679,47 @@ class SteveJobs:
         # TODO: add allowlist checks here
 
         processing_results: list[TaskResults] = []
+        signatures = []
+        # the event doesn't change while the tasks are created, serialize it once
+        event_dict = self.event.get_dict()
 
         for handler_kls in matching_handlers:
             if not handler_kls.pre_check(
                     package_config=None,
                     job_config=None,
-                    event=self.event.get_dict(),
+                    event=event_dict,
             ):
                 continue
 
-            self.report_task_accepted_for_fedora_ci(handler_kls)
+            self.report_task_accepted_for_fedora_ci(handler_kls, event_dict)
 
-            celery_signature = celery.signature(
-                handler_kls.task_name.value,
-                kwargs={
-                    "package_config": None,
-                    "job_config": None,
-                    "event": self.event.get_dict(),
-                },
+            signatures.append(
+                celery.signature(
+                    handler_kls.task_name.value,
+                    kwargs={
+                        "package_config": None,
+                        "job_config": None,
+                        "event": event_dict,
+                    },
+                ),
             )
-
-            celery_signature.apply_async()
-            logger.debug(f"Celery signature sent for handler {handler_kls}.")
+            logger.debug(f"Got signature for handler {handler_kls}.")
 
             processing_results.append(
                 TaskResults(
                     success=True,
                     details={
                         "msg": "Job created.",
-                        "event": self.event.get_dict(),
+                        "event": event_dict,
                     },
                 )
             )
 
+        if signatures:
+            # https://docs.celeryq.dev/en/stable/userguide/canvas.html#groups
+            celery.group(signatures).apply_async()
+            logger.debug("Signatures for Fedora CI were sent to Celery.")
+
         return processing_results
 
     def process_jobs(self) -> list[TaskResults]:
@@ -599,12 +730,9 @@ class SteveJobs:
         Returns:
             List of the results of each task.
         """
-        if isinstance(
-                self.event,
-                abstract.comment.CommentEvent,
-        ) and not get_handlers_for_comment(
-            self.event.comment,
-            packit_comment_command_prefix=self.service_config.comment_command_prefix,
+        if (
+                isinstance(self.event, abstract.comment.CommentEvent)
+                and not self.handlers_for_comment
         ):
             return [
                 TaskResults(
@@ -674,14 +802,9 @@ class SteveJobs:
                 self.report_task_accepted(
                     handler_kls=handler_kls,
                     job_config=job_config,
-                    update_feedback_time=lambda t: statuses_check_feedback.append(
-                        t),
+                    update_feedback_time=statuses_check_feedback.append,
                 )
-                if handler_kls in (
-                        CoprBuildHandler,
-                        TestingFarmHandler,
-                        KojiBuildHandler,
-                ):
+                if handler_kls in PACKAGES_CONFIG_STORING_HANDLERS:
                     self.event.store_packages_config()
 
                 signatures.append(
@@ -762,23 +885,21 @@ class SteveJobs:
             List of job configs.
         """
 
-        def compare_jobs_without_triggers(a, b):
-            # check if two jobs are the same or differ only in trigger
-            ad = dict(a.__dict__)
-            ad.pop("trigger")
-            bd = dict(b.__dict__)
-            bd.pop("trigger")
-            return ad == bd
+        def job_without_trigger(job) -> dict:
+            # jobs that are the same or differ only in trigger are equal
+            job_dict = dict(job.__dict__)
+            job_dict.pop("trigger")
+            return job_dict
 
         def event_is_koji_tag_command():
-            commands = get_packit_commands_from_comment(
-                self.event.comment, self.service_config.comment_command_prefix
-            )
+            commands = self.comment_commands
             if not commands:
                 return False
             return commands[0] == "koji-tag"
 
         matching_jobs: list[JobConfig] = []
+        # matching koji_build jobs without their triggers, computed once per job
+        matching_koji_build_jobs: list[dict] = []
         if isinstance(self.event, pagure.pr.Comment):
             for job in self.event.packages_config.get_job_views():
                 if (
@@ -789,11 +910,13 @@ class SteveJobs:
                 ):
                     if job.type == JobType.koji_build:
                         # avoid having duplicate koji_build jobs
-                        if any(j for j in matching_jobs if compare_jobs_without_triggers(job, j)):
+                        job_dict = job_without_trigger(job)
+                        if job_dict in matching_koji_build_jobs:
                             continue
                         # in case of koji-tag command, match only koji_build jobs with sidetag group
                         if event_is_koji_tag_command() and not job.sidetag_group:
                             continue
+                        matching_koji_build_jobs.append(job_dict)
                     # A koji_build or bodhi_update job with commit or koji_build trigger
                     # can be re-triggered by a Pagure comment in a PR
                     matching_jobs.append(job)
@@ -814,10 +937,11 @@ class SteveJobs:
                         and self.event.job_config_trigger_type == JobConfigTriggerType.release
                 ):
                     # avoid having duplicate koji_build jobs
-                    if job.type == JobType.koji_build and any(
-                            j for j in matching_jobs if compare_jobs_without_triggers(job, j)
-                    ):
-                        continue
+                    if job.type == JobType.koji_build:
+                        job_dict = job_without_trigger(job)
+                        if job_dict in matching_koji_build_jobs:
+                            continue
+                        matching_koji_build_jobs.append(job_dict)
                     # A koji_build/bodhi_update can be re-triggered by a
                     # comment in a issue in the repository issues
                     # after a failed release event
@@ -847,34 +971,51 @@ class SteveJobs:
         Returns:
             List of all jobs that match the event's trigger.
         """
+        return self.jobs_matching_event
+
+    @cached_property
+    def jobs_matching_event(self) -> list[JobConfig]:
+        """
+        Jobs matching the event's trigger, computed only once since they are needed
+        both for getting the handlers and for getting the configs of each of them.
+        """
+        # the event doesn't change while matching, check its type only once
+        trigger = self.event.job_config_trigger_type
+        is_rerun = isinstance(self.event, github.check.Rerun)
+        job_identifier = self.event.job_identifier if is_rerun else None
+        is_manual_or_result = isinstance(self.event, MANUAL_OR_RESULT_EVENTS)
+        check_pr_labels = (
+            trigger == JobConfigTriggerType.pull_request
+            and isinstance(self.event, abstract.base.ForgeIndependent)
+        )
+
+        # jobs usually share the label requirements, check the PR labels once per each
+        labels_match: dict[tuple[frozenset[str], frozenset[str]], bool] = {}
+
         jobs_matching_trigger = []
         for job in self.event.packages_config.get_job_views():
-            if (
-                    job.trigger == self.event.job_config_trigger_type
-                    and (
-                    not isinstance(self.event, github.check.Rerun)
-                    or self.event.job_identifier == job.identifier
-                    )
-                    and job not in jobs_matching_trigger
+            if not (
+                    job.trigger == trigger
+                    and (not is_rerun or job_identifier == job.identifier)
                     # Manual trigger condition
-                    and (
-                    not job.manual_trigger
-                    or any(
-                        isinstance(self.event, event_type) for event_type in MANUAL_OR_RESULT_EVENTS
-                    )
-                    )
-                    and (
-                    job.trigger != JobConfigTriggerType.pull_request
-                    or not (job.require.label.present or job.require.label.absent)
-                    or not isinstance(self.event, abstract.base.ForgeIndependent)
-                    or pr_labels_match_configuration(
+                    and (not job.manual_trigger or is_manual_or_result)
+                    and job not in jobs_matching_trigger
+            ):
+                continue
+
+            present, absent = job.require.label.present, job.require.label.absent
+            if check_pr_labels and (present or absent):
+                labels = (frozenset(present or ()), frozenset(absent or ()))
+                if labels not in labels_match:
+                    labels_match[labels] = pr_labels_match_configuration(
                         pull_request=self.event.pull_request_object,
-                        configured_labels_absent=job.require.label.absent,
-                        configured_labels_present=job.require.label.present,
-                    )
+                        configured_labels_absent=absent,
+                        configured_labels_present=present,
                     )
-            ):
-                jobs_matching_trigger.append(job)
+                if not labels_match[labels]:
+                    continue
+
+            jobs_matching_trigger.append(job)
 
         jobs_matching_trigger.extend(self.check_explicit_matching())
 
@@ -894,10 +1035,7 @@ class SteveJobs:
         handlers_triggered_by_job = None
 
         if isinstance(self.event, abstract.comment.CommentEvent):
-            handlers_triggered_by_job = get_handlers_for_comment(
-                self.event.comment,
-                self.service_config.comment_command_prefix,
-            )
+            handlers_triggered_by_job = self.handlers_for_comment
 
             if handlers_triggered_by_job and not isinstance(
                     self.event,
@@ -933,9 +1071,7 @@ class SteveJobs:
 
         matching_handlers: set[type[JobHandler]] = set()
         for job in jobs_matching_trigger:
-            for handler in (
-                    MAP_JOB_TYPE_TO_HANDLER[job.type] | MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job.type]
-            ):
+            for handler in get_handlers_for_job_type(job.type):
                 if self.is_handler_matching_the_event(
                         handler=handler,
                         allowed_handlers=handlers_triggered_by_job,
@@ -944,11 +1080,11 @@ class SteveJobs:
 
         if not matching_handlers:
             logger.debug(
-                f"We did not find any handler for a following event:\n{
-                    self.event.event_type()}",
+                "We did not find any handler for a following event:\n%s",
+                self.event.event_type(),
             )
 
-        logger.debug(f"Matching handlers: {matching_handlers}")
+        logger.debug("Matching handlers: %s", matching_handlers)
 
         return matching_handlers
 
@@ -973,10 +1109,9 @@ class SteveJobs:
             allowed_handlers is None or handler in allowed_handlers
         )
 
-        return (
-            isinstance(self.event, tuple(
-                SUPPORTED_EVENTS_FOR_HANDLER[handler]))
-            and handler_matches_to_comment_or_check_rerun_job
+        return handler_matches_to_comment_or_check_rerun_job and isinstance(
+            self.event,
+            get_supported_events_for_handler(handler),
         )
 
     def get_config_for_handler_kls(
@@ -1005,19 +1140,20 @@ class SteveJobs:
         """
         jobs_matching_trigger: list[JobConfig] = self.get_jobs_matching_event()
 
-        matching_jobs: list[JobConfig] = [
-            job for job in jobs_matching_trigger if handler_kls in MAP_JOB_TYPE_TO_HANDLER[job.type]
-        ]
+        # sort the jobs in a single walk, the required ones are used only as a fallback
+        matching_jobs: list[JobConfig] = []
+        requiring_jobs: list[JobConfig] = []
+        for job in jobs_matching_trigger:
+            if handler_kls in MAP_JOB_TYPE_TO_HANDLER[job.type]:
+                matching_jobs.append(job)
+            elif handler_kls in MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job.type]:
+                requiring_jobs.append(job)
 
         if not matching_jobs:
             logger.debug(
                 "No config found, let's see the jobs that requires this handler.",
             )
-            matching_jobs = [
-                job
-                for job in jobs_matching_trigger
-                if handler_kls in MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job.type]
-            ]
+            matching_jobs = requiring_jobs
 
         if not matching_jobs:
             logger.warning(
@@ -1026,11 +1162,12 @@ class SteveJobs:
                 f"{self.event.event_type()}",
             )
 
-        logger.debug(
-            "Jobs matching %s: %s",
-            handler_kls.__qualname__,
-            [str(j) for j in matching_jobs],
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Jobs matching %s: %s",
+                handler_kls.__qualname__,
+                [str(j) for j in matching_jobs],
+            )
 
         return matching_jobs
 
@@ -1053,8 +1190,8 @@ class SteveJobs:
             end=statuses_check_feedback[0],
         )
         logger.debug(
-            f"Reporting first initial status check time: {
-                response_time} seconds.",
+            "Reporting first initial status check time: %s seconds.",
+            response_time,
         )
         self.pushgateway.first_initial_status_time.observe(response_time)
         if response_time > 25:
@@ -1062,10 +1199,10 @@ class SteveJobs:
         if response_time > 15:
             # https://github.com/packit/packit-service/issues/1728
             # we need more info why this has happened
-            logger.debug(f"Event dict: {self.event}.")
+            logger.debug("Event dict: %s.", self.event)
             logger.error(
-                f"Event {self.event.event_type(
-                )} took more than 15s to process.",
+                "Event %s took more than 15s to process.",
+                self.event.event_type(),
             )
         # set the time when the accepted status was set so that we
         # can use it later for measurements
@@ -1076,8 +1213,8 @@ class SteveJobs:
             end=statuses_check_feedback[-1],
         )
         logger.debug(
-            f"Reporting last initial status check time: {
-                response_time} seconds.",
+            "Reporting last initial status check time: %s seconds.",
+            response_time,
         )
         self.pushgateway.last_initial_status_time.observe(response_time)
 
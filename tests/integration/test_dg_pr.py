@@ -5,7 +5,7 @@ import json
 from pathlib import Path
 
 import pytest
-from celery.canvas import Signature
+from celery.canvas import group as celery_group
 from flexmock import flexmock
 from ogr.abstract import CommitStatus
 from ogr.services.pagure import PagureProject
@@ -130,7 +130,7 @@ def test_downstream_koji_scratch_build(distgit_pr_event, target_branch, uid, che
     )
 
     flexmock(LocalProjectBuilder, _refresh_the_state=lambda *args: None)
-    flexmock(Signature).should_receive("apply_async").once()
+    flexmock(celery_group).should_receive("apply_async").once()
     flexmock(Pushgateway).should_receive("push").times(2).and_return()
     flexmock(commands).should_receive("run_command_remote").with_args(
         cmd=[
@@ -27,6 +27,7 @@ from packit.local_project import LocalProject
 from packit.utils.koji_helper import KojiHelper
 
 import packit_service.service.urls as urls
+import packit_service.worker.handlers.copr
 from packit_service.config import ServiceConfig
 from packit_service.constants import COPR_API_FAIL_STATE, DEFAULT_RETRY_LIMIT
 from packit_service.events import copr, koji
@@ -50,6 +51,7 @@ from packit_service.service.urls import (
     get_srpm_build_info_url,
 )
 from packit_service.worker.handlers import CoprBuildEndHandler
+from packit_service.worker.handlers.abstract import TaskName
 from packit_service.worker.handlers.bodhi import BodhiUpdateFromSidetagHandler
 from packit_service.worker.handlers.distgit import DownstreamKojiBuildHandler
 from packit_service.worker.handlers.testing_farm import aliases
@@ -81,6 +83,27 @@ EXPECTED_TESTING_FARM_CHECK_NAME = f"testing-farm:{CHROOT}"
 pytestmark = pytest.mark.usefixtures("mock_get_valid_build_targets")
 
 
+def expect_testing_farm_group(*identifiers):
+    """
+    Expect one group with a Testing Farm task for each of the test jobs
+    (given by their identifiers) to be sent after the end of the Copr build.
+    """
+
+    def check_group(signatures):
+        assert [sig.task for sig in signatures] == [TaskName.testing_farm.value] * len(
+            identifiers,
+        )
+        assert [
+            {identifier for _, identifier in sig.kwargs["event"]["tests_targets_override"]}
+            for sig in signatures
+        ] == [{identifier} for identifier in identifiers]
+        return flexmock(apply_async=lambda: None)
+
+    flexmock(packit_service.worker.handlers.copr).should_receive("group").replace_with(
+        check_group,
+    ).once()
+
+
 @pytest.fixture
 def mock_get_valid_build_targets():
     flexmock(CoprHelper).should_receive("get_valid_build_targets").and_return(
@@ -792,8 +815,8 @@ def test_copr_build_end_testing_farm(copr_build_end, copr_build_pr):
         links_to_external_services=None,
         update_feedback_time=object,
     ).once()
-    flexmock(Signature).should_receive("apply_async").once()
     flexmock(celery_group).should_receive("apply_async").once()
+    expect_testing_farm_group(None)
 
     # skip SRPM url since it touches multiple classes
     flexmock(CoprBuildEndHandler).should_receive("set_srpm_url").and_return(None)
@@ -826,6 +849,9 @@ def test_copr_build_end_testing_farm(copr_build_end, copr_build_pr):
     flexmock(CoprBuildTargetModel).should_receive("get_all_by").and_return(
         [copr_build_pr],
     )
+    flexmock(CoprBuildTargetModel).should_receive("get_project_event_by_build_id").and_return(
+        copr_build_pr.get_project_event_model(),
+    )
     event_dict["tests_targets_override"] = [("fedora-rawhide-x86_64", None)]
     run_testing_farm_handler(
         package_config=package_config,
@@ -938,8 +964,8 @@ def test_copr_build_end_testing_farm_pr_branch(copr_build_end, copr_build_pr):
         "https://github.com/foo/bar",
     )
 
-    flexmock(Signature).should_receive("apply_async").once()
     flexmock(celery_group).should_receive("apply_async").once()
+    expect_testing_farm_group(None)
 
     # skip SRPM url since it touches multiple classes
     flexmock(CoprBuildEndHandler).should_receive("set_srpm_url").and_return(None)
@@ -1369,8 +1395,8 @@ def test_copr_build_end_testing_farm_labels_matching(copr_build_end, copr_build_
         "https://github.com/foo/bar",
     )
 
-    flexmock(Signature).should_receive("apply_async").once()
     flexmock(celery_group).should_receive("apply_async").once()
+    expect_testing_farm_group(None)
 
     # skip SRPM url since it touches multiple classes
     flexmock(CoprBuildEndHandler).should_receive("set_srpm_url").and_return(None)
@@ -1615,8 +1641,8 @@ def test_copr_build_end_push_testing_farm(copr_build_end_push, copr_build_branch
         chroot=copr_build_end_push["chroot"],
     ).once()
 
-    flexmock(Signature).should_receive("apply_async").once()
     flexmock(celery_group).should_receive("apply_async").once()
+    expect_testing_farm_group(None)
 
     # skip SRPM url since it touches multiple classes
     flexmock(CoprBuildEndHandler).should_receive("set_srpm_url").and_return(None)
@@ -1879,8 +1905,8 @@ def test_copr_build_end_report_multiple_testing_farm_jobs(
         "https://github.com/foo/bar",
     )
 
-    flexmock(Signature).should_receive("apply_async").times(2)
-    flexmock(celery_group).should_receive("apply_async").times(1)
+    flexmock(celery_group).should_receive("apply_async").once()
+    expect_testing_farm_group("test1", "test2")
 
     # skip SRPM url since it touches multiple classes
     flexmock(CoprBuildEndHandler).should_receive("set_srpm_url").and_return(None)
@@ -2062,8 +2088,8 @@ def test_copr_build_end_failed_testing_farm(copr_build_end, copr_build_pr):
         update_feedback_time=object,
     ).once()
 
-    flexmock(Signature).should_receive("apply_async").once()
     flexmock(celery_group).should_receive("apply_async").once()
+    expect_testing_farm_group(None)
 
     (
         flexmock(CoprBuildJobHelper)
@@ -2093,6 +2119,9 @@ def test_copr_build_end_failed_testing_farm(copr_build_end, copr_build_pr):
         job_config=job_config,
     )
 
+    flexmock(CoprBuildTargetModel).should_receive("get_project_event_by_build_id").and_return(
+        copr_build_pr.get_project_event_model(),
+    )
     event_dict["tests_targets_override"] = [("fedora-rawhide-x86_64", None)]
     run_testing_farm_handler(
         package_config=package_config,
@@ -2251,8 +2280,8 @@ def test_copr_build_end_failed_testing_farm_no_json(copr_build_end, copr_build_p
         update_feedback_time=object,
     ).once()
 
-    flexmock(Signature).should_receive("apply_async").once()
     flexmock(celery_group).should_receive("apply_async").once()
+    expect_testing_farm_group(None)
 
     (
         flexmock(CoprBuildJobHelper)
@@ -2281,6 +2310,9 @@ def test_copr_build_end_failed_testing_farm_no_json(copr_build_end, copr_build_p
         job_config=job_config,
     )
 
+    flexmock(CoprBuildTargetModel).should_receive("get_project_event_by_build_id").and_return(
+        copr_build_pr.get_project_event_model(),
+    )
     event_dict["tests_targets_override"] = [("fedora-rawhide-x86_64", None)]
     task = run_testing_farm_handler.__wrapped__.__func__
     task(
@@ -2830,7 +2862,7 @@ def test_koji_build_end_downstream(
 
     urls.DASHBOARD_URL = "https://dashboard.localhost"
 
-    flexmock(Signature).should_receive("apply_async").twice()
+    flexmock(celery_group).should_receive("apply_async").once()
     flexmock(Pushgateway).should_receive("push").times(3).and_return()
 
     processing_results = SteveJobs().process_message(koji_build_scratch_end)
@@ -2931,13 +2963,18 @@ def test_srpm_build_end(srpm_build_end, pc_build_pr, srpm_build_model):
     flexmock(CoprHelper).should_receive("get_copr_client").and_return(
         Client(config={"username": "packit", "copr_url": "https://dummy.url"}),
     )
-    flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_id").and_return(
-        [
-            flexmock(target="fedora-33-x86_64", identifier=None)
-            .should_receive("set_status")
-            .with_args(BuildStatus.pending)
-            .mock(),
-        ],
+    flexmock(CoprBuildTargetModel).should_receive(
+        "get_build_and_targets_by_copr_build_id",
+    ).and_return(
+        (
+            srpm_build_model,
+            [
+                flexmock(target="fedora-33-x86_64", identifier=None)
+                .should_receive("set_status")
+                .with_args(BuildStatus.pending)
+                .mock(),
+            ],
+        ),
     )
     (
         flexmock(CoprBuildJobHelper)
@@ -2999,9 +3036,9 @@ def test_srpm_build_end_failure(srpm_build_end, pc_build_pr, srpm_build_model):
     flexmock(CoprHelper).should_receive("get_copr_client").and_return(
         Client(config={"username": "packit", "copr_url": "https://dummy.url"}),
     )
-    flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_id").and_return(
-        [flexmock(target="fedora-33-x86_64", identifier=None)],
-    )
+    flexmock(CoprBuildTargetModel).should_receive(
+        "get_build_and_targets_by_copr_build_id",
+    ).and_return((srpm_build_model, [flexmock(target="fedora-33-x86_64", identifier=None)]))
     (
         flexmock(CoprBuildJobHelper)
         .should_receive("get_build")
@@ -3062,9 +3099,9 @@ def test_srpm_build_start(srpm_build_start, pc_build_pr, srpm_build_model):
     flexmock(CoprHelper).should_receive("get_copr_client").and_return(
         Client(config={"username": "packit", "copr_url": "https://dummy.url"}),
     )
-    flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_id").and_return(
-        [flexmock(target="fedora-33-x86_64", identifier=None)],
-    )
+    flexmock(CoprBuildTargetModel).should_receive(
+        "get_build_and_targets_by_copr_build_id",
+    ).and_return((srpm_build_model, [flexmock(target="fedora-33-x86_64", identifier=None)]))
     flexmock(Pushgateway).should_receive("push").times(2).and_return()
 
     flexmock(SRPMBuildModel).should_receive("get_by_copr_build_id").and_return(
@@ -6,7 +6,6 @@ import shutil
 from pathlib import Path
 
 import pytest
-from celery.canvas import Signature
 from celery.canvas import group as celery_group
 from flexmock import flexmock
 from github.MainClass import Github
@@ -2574,7 +2573,7 @@ def test_downstream_koji_scratch_build_retrigger_via_dist_git_pr_comment(
     )
 
     flexmock(LocalProjectBuilder, _refresh_the_state=lambda *args: None)
-    flexmock(Signature).should_receive("apply_async").once()
+    flexmock(celery_group).should_receive("apply_async").once()
     flexmock(Pushgateway).should_receive("push").times(2).and_return()
     flexmock(commands).should_receive("run_command_remote").with_args(
         cmd=[
@@ -3436,7 +3435,7 @@ def test_downstream_testing_farm_retrigger_via_dist_git_pr_comment(
         TaskResults(success=True, details={}),
     )
 
-    flexmock(Signature).should_receive("apply_async").once()
+    flexmock(celery_group).should_receive("apply_async").once()
     flexmock(Pushgateway).should_receive("push").times(2).and_return()
 
     processing_results = SteveJobs().process_message(pagure_pr_comment_added)
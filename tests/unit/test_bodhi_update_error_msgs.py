@@ -134,13 +134,17 @@ def test_pull_request_retrigger_bodhi_update_with_koji_data(
             ],
         ),
     )
-    flexmock(RetriggerBodhiUpdateHandler).should_receive("__next__").and_return(
-        KojiBuildData(
-            dist_git_branch="f36",
-            build_id=1,
-            nvr="a_package_1.f36",
-            state=1,
-            task_id=123,
+    flexmock(RetriggerBodhiUpdateHandler).should_receive("__iter__").and_return(
+        iter(
+            [
+                KojiBuildData(
+                    dist_git_branch="f36",
+                    build_id=1,
+                    nvr="a_package_1.f36",
+                    state=1,
+                    task_id=123,
+                ),
+            ],
         ),
     )
     flexmock(BodhiUpdateTargetModel).should_receive(
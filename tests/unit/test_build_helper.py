@@ -2865,6 +2865,8 @@ def test_check_if_custom_copr_can_be_used_and_report(
         0 if allowed else 1,
     )
     assert copr_build_helper.check_if_custom_copr_can_be_used_and_report() is allowed
+    # the result is cached, Copr is not asked (and the status not reported) again
+    assert copr_build_helper.check_if_custom_copr_can_be_used_and_report() is allowed
 
 
 @pytest.mark.parametrize(
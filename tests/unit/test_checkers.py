@@ -402,7 +402,7 @@ def test_copr_build_is_package_matching_job_view():
         jobs[0],
         {"pkg": "package"},
     )
-    checker._build = (
+    checker.build = (
         flexmock().should_receive("get_package_name").and_return("package-b").once().mock()
     )
 
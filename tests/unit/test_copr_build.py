@@ -337,7 +337,7 @@ def test_run_copr_build_from_source_script(github_pr_event, srpm_build_deps):
         event=github_pr_event.get_dict(),
         celery_task=flexmock(),
     )
-    handler._copr_build_helper = helper
+    handler.copr_build_helper = helper
     assert handler.run()["success"]
 
 
@@ -1,18 +1,24 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import copy
+import pickle
 from typing import Optional
 
+import pytest
 from flexmock import flexmock
 from ogr.abstract import GitProject
 from packit.utils.koji_helper import KojiHelper
 
 from packit_service.config import ServiceConfig
 from packit_service.constants import KojiBuildState
+from packit_service.events import github
 from packit_service.worker.handlers.mixin import (
+    GetGithubCommentEventMixin,
     GetKojiBuildDataFromKojiBuildEventMixin,
     GetKojiBuildDataFromKojiServiceMixin,
     GetKojiBuildDataFromKojiServiceMultipleBranches,
+    KojiBuildData,
 )
 
 
@@ -42,6 +48,19 @@ def test_GetKojiBuildDataFromKojiServiceMixin():
     assert len(data) == 1
 
 
+def test_KojiBuildData_copy_and_pickle():
+    data = KojiBuildData(
+        dist_git_branch="rawhide",
+        build_id=123,
+        nvr="1.0.0",
+        state=KojiBuildState.complete,
+        task_id=321,
+    )
+    assert not hasattr(data, "__dict__")
+    assert copy.copy(data) == data
+    assert pickle.loads(pickle.dumps(data)) == data
+
+
 def test_GetKojiBuildDataFromKojiBuildEventMixin():
     class Test(GetKojiBuildDataFromKojiBuildEventMixin):
         def __init__(self):
@@ -107,3 +126,56 @@ def test_GetKojiBuildDataFromKojiServiceMultipleBranches():
         assert koji_build_data.dist_git_branch in ("f37", "f38")
     assert mixin.num_of_branches == 2
     assert len(data) == 2
+
+
+@pytest.mark.parametrize(
+    "event_type, comment, result",
+    [
+        pytest.param(
+            github.pr.Comment.event_type(),
+            "/packit build",
+            True,
+            id="build command",
+        ),
+        pytest.param(
+            github.pr.Comment.event_type(),
+            "Looks good.\n/packit copr-build",
+            True,
+            id="copr-build command on a later line",
+        ),
+        pytest.param(
+            github.pr.Comment.event_type(),
+            "/packit test",
+            False,
+            id="other command",
+        ),
+        pytest.param(
+            github.pr.Comment.event_type(),
+            "/packit",
+            False,
+            id="prefix without a command",
+        ),
+        pytest.param(
+            github.pr.Comment.event_type(),
+            "Looks good.",
+            False,
+            id="no command",
+        ),
+        pytest.param(
+            github.push.Commit.event_type(),
+            "/packit build",
+            False,
+            id="not a comment event",
+        ),
+    ],
+)
+def test_is_copr_build_comment_event(event_type, comment, result):
+    class Test(GetGithubCommentEventMixin):
+        def __init__(self):
+            self.data = flexmock(event_type=event_type, event_dict={"comment": comment})
+
+        @property
+        def service_config(self) -> ServiceConfig:
+            return flexmock(comment_command_prefix="/packit")
+
+    assert Test().is_copr_build_comment_event() is result
@@ -15,11 +15,13 @@ from packit.config import (
     PackageConfig,
 )
 
+import packit_service.worker.jobs
 from packit_service.config import ServiceConfig
 from packit_service.constants import COMMENT_REACTION
 from packit_service.events import (
     abstract,
     copr,
+    forgejo,
     github,
     gitlab,
     koji,
@@ -40,12 +42,21 @@ from packit_service.worker.handlers import (
     TestingFarmResultsHandler,
 )
 from packit_service.worker.handlers.bodhi import CreateBodhiUpdateHandler
-from packit_service.worker.handlers.distgit import DownstreamKojiBuildHandler
+from packit_service.worker.handlers.distgit import (
+    DownstreamKojiBuildHandler,
+    DownstreamKojiScratchBuildHandler,
+)
 from packit_service.worker.handlers.koji import (
     KojiBuildReportHandler,
     KojiBuildTagHandler,
+    KojiTaskReportDownstreamHandler,
+)
+from packit_service.worker.jobs import (
+    SteveJobs,
+    get_fedora_ci_handlers_for_event_type,
+    get_forgejo_pr_fields,
+    get_handlers_for_check_rerun,
 )
-from packit_service.worker.jobs import SteveJobs, get_handlers_for_check_rerun
 from packit_service.worker.result import TaskResults
 
 
@@ -2579,6 +2590,27 @@ def test_get_handlers_triggered_by_comment(
     assert event_handlers == result
 
 
+def test_comment_commands_parsed_once():
+    class Event(github.pr.Comment):
+        def __init__(self):
+            self.comment = "/packit test"
+
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        ServiceConfig(comment_command_prefix="/packit"),
+    )
+    flexmock(packit_service.worker.jobs).should_receive(
+        "get_packit_commands_from_comment"
+    ).with_args(
+        "/packit test",
+        "/packit",
+    ).and_return(["test"]).once()
+
+    steve = SteveJobs(Event())
+    assert steve.handlers_for_comment == {TestingFarmHandler}
+    assert steve.comment_commands == ["test"]
+    assert steve.handlers_for_comment == {TestingFarmHandler}
+
+
 @pytest.mark.parametrize(
     "event_kls,check_name_job,result",
     [
@@ -3633,3 +3665,84 @@ def test_unapproved_jobs():
     assert all(not result["success"] for result in results), (
         "all of them must've failed the permission check"
     )
+
+
+@pytest.mark.parametrize(
+    "body, fields",
+    [
+        pytest.param("", {}, id="empty"),
+        pytest.param(
+            "New package\r\n- Package Name: foo\r\nVersion: 1.0\nLicense: MIT",
+            {"package_name": "foo", "package_version": "1.0", "package_license": "MIT"},
+            id="crlf-and-prefix",
+        ),
+        pytest.param(
+            "\r\n\n  Version:  3 \r\n\nno field here\n",
+            {"package_version": "3"},
+            id="blank-and-indented-lines",
+        ),
+        pytest.param(
+            "Package Name: foo\npackage_name: bar\nVersion: 1.0\nDescription: a tool\n"
+            "FAS username: @me\nLicense: MIT",
+            {
+                "package_name": "bar",
+                "package_version": "1.0",
+                "package_description": "a tool",
+                "fas_username": "@me",
+                "package_license": "MIT",
+            },
+            id="all-fields",
+        ),
+        pytest.param(
+            "Description: a tool\nVersion: 2 Package Name: foo",
+            {"package_description": "a tool", "package_name": "foo"},
+            id="priority-on-one-line",
+        ),
+        pytest.param(
+            "package_name: bar\nPackage Name:",
+            {"package_name": "bar"},
+            id="empty-name-does-not-override",
+        ),
+        pytest.param(
+            "Package Name: foo\npackage_name: bar",
+            {"package_name": "bar"},
+            id="later-line-wins",
+        ),
+    ],
+)
+def test_get_forgejo_pr_fields(body, fields):
+    assert get_forgejo_pr_fields(body) == fields
+
+
+@pytest.mark.parametrize(
+    "body, package_name",
+    [
+        pytest.param("Package Name: foo\nVersion: 1.0", "foo", id="package-name"),
+        pytest.param("Description: tool Package Name: foo", "foo", id="name-after-description"),
+        pytest.param("Description: a tool", None, id="no-package-name"),
+    ],
+)
+def test_is_packit_config_present_forgejo(body, package_name):
+    class Event(forgejo.pr.Action):
+        def __init__(self):
+            self.body = body
+
+    event = Event()
+
+    assert SteveJobs(event).is_packit_config_present()
+    assert list(event._package_config.packages) == [package_name]
+    assert event._package_config.packages[package_name].specfile_path == (
+        f"{package_name}.spec" if package_name else None
+    )
+
+
+@pytest.mark.parametrize(
+    "event_type, handlers",
+    [
+        pytest.param(pagure.pr.Action, {DownstreamKojiScratchBuildHandler}, id="pagure-pr"),
+        pytest.param(koji.result.Task, {KojiTaskReportDownstreamHandler}, id="koji-task"),
+        pytest.param(github.pr.Action, set(), id="github-pr"),
+    ],
+)
+def test_get_fedora_ci_handlers_for_event_type(event_type, handlers):
+    assert get_fedora_ci_handlers_for_event_type(event_type) == handlers
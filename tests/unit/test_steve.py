@@ -43,6 +43,7 @@ from packit_service.worker.helpers.sync_release.propose_downstream import (
 )
 from packit_service.worker.jobs import SteveJobs
 from packit_service.worker.monitoring import Pushgateway
+from packit_service.worker.parser import Parser
 from packit_service.worker.reporting import BaseCommitStatus
 from packit_service.worker.reporting.news import DistgitAnnouncement
 from packit_service.worker.tasks import run_propose_downstream_handler
@@ -280,3 +281,14 @@ def test_ignore_delete_branch(github_push):
     processing_results = SteveJobs.process_message(github_push)
 
     assert processing_results == []
+
+
+def test_process_message_pushes_metrics_on_failure():
+    flexmock(Parser).should_receive("parse_event").and_return(
+        flexmock(pre_check=lambda: True),
+    )
+    flexmock(SteveJobs).should_receive("process").and_raise(RuntimeError)
+
+    flexmock(Pushgateway).should_receive("push").once()
+    with pytest.raises(RuntimeError):
+        SteveJobs.process_message(EVENT)
@@ -1,9 +1,15 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 import pytest
+import requests
 from flexmock import flexmock
 
-from packit_service.utils import only_once, pr_labels_match_configuration
+from packit_service.utils import (
+    download_file,
+    get_package_nvrs,
+    only_once,
+    pr_labels_match_configuration,
+)
 
 
 def test_only_once():
@@ -160,3 +166,33 @@ def test_pr_labels_match(absent, present, pr_labels, should_pass):
         pr_labels_match_configuration(flexmock(labels=pr_labels, id=1), present, absent)
         == should_pass
     )
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        pytest.param({}, id="no-content-length"),
+        pytest.param({"Content-Length": "11"}, id="exact-content-length"),
+        pytest.param({"Content-Length": "1024"}, id="bigger-content-length"),
+    ],
+)
+def test_download_file(tmp_path, headers):
+    response = flexmock(headers=headers, raise_for_status=lambda: None)
+    response.should_receive("iter_content").and_return([b"hello", b" world"])
+    flexmock(requests).should_receive("get").and_return(response)
+
+    path = tmp_path / "downloaded"
+    assert download_file("https://example.com/file", path)
+    assert path.read_bytes() == b"hello world"
+
+
+def test_get_package_nvrs():
+    built_packages = [
+        {"name": "foo", "epoch": 0, "version": "1.0", "release": "1.fc40", "arch": "src"},
+        {"name": "foo", "epoch": 0, "version": "1.0", "release": "1.fc40", "arch": "x86_64"},
+        {"name": "bar", "epoch": 2, "version": "0.1", "release": "3.fc40", "arch": "noarch"},
+    ]
+    assert get_package_nvrs(built_packages) == [
+        "foo-1.0-1.fc40.x86_64",
+        "bar-2:0.1-3.fc40.noarch",
+    ]
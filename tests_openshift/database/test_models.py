@@ -317,6 +317,42 @@ def test_get_all_build_id(clean_before_and_after, multiple_copr_builds):
     assert builds_list[1].project_name == "the-project-name"
 
 
+def test_get_project_event_by_build_id(clean_before_and_after, a_copr_build_for_pr):
+    project_event = CoprBuildTargetModel.get_project_event_by_build_id(a_copr_build_for_pr.id)
+    assert project_event.id == a_copr_build_for_pr.get_project_event_model().id
+
+    assert CoprBuildTargetModel.get_project_event_by_build_id(a_copr_build_for_pr.id + 1) is None
+
+
+def test_get_build_and_targets_by_copr_build_id(
+    clean_before_and_after,
+    srpm_build_in_copr_model,
+):
+    srpm_model, run_model = srpm_build_in_copr_model
+    group = CoprBuildGroupModel.create(run_model)
+    for target in (SampleValues.target, SampleValues.different_target):
+        CoprBuildTargetModel.create(
+            build_id=srpm_model.copr_build_id,
+            project_name=SampleValues.project,
+            owner=SampleValues.owner,
+            web_url=SampleValues.copr_web_url,
+            target=target,
+            status=SampleValues.status_waiting_for_srpm,
+            copr_build_group=group,
+        )
+
+    srpm_build, targets = CoprBuildTargetModel.get_build_and_targets_by_copr_build_id(
+        int(srpm_model.copr_build_id),
+    )
+    assert srpm_build.id == srpm_model.id
+    assert {build.target for build in targets} == {
+        SampleValues.target,
+        SampleValues.different_target,
+    }
+
+    assert CoprBuildTargetModel.get_build_and_targets_by_copr_build_id("0") == (None, [])
+
+
 # returns the first copr build with given build id and target
 def test_get_by_build_id(clean_before_and_after, multiple_copr_builds):
     # these are not iterable and thus should be accessible directly
@@ -372,6 +408,25 @@ def test_copr_get_all_by_owner_project_commit_target(
         == SampleValues.ref
     )
 
+    # test filtering by the project event object
+    pr_id = multiple_copr_builds[0].get_project_event_object().id
+    different_pr_id = multiple_copr_builds[-1].get_project_event_object().id
+    builds_list_for_pr = list(
+        CoprBuildTargetModel.get_all_by(
+            project_name=SampleValues.project,
+            commit_sha=SampleValues.ref,
+            project_event_object_id=pr_id,
+        ),
+    )
+    assert len(builds_list_for_pr) == 3
+    assert not list(
+        CoprBuildTargetModel.get_all_by(
+            project_name=SampleValues.project,
+            commit_sha=SampleValues.ref,
+            project_event_object_id=different_pr_id,
+        ),
+    )
+
 
 def test_copr_get_all_by_commit(clean_before_and_after, multiple_copr_builds):
     builds_list = list(